@@ -3,6 +3,7 @@ VT CS AI Academic Advisor
 Comprehensive AI service with VT-specific rules, course data, and degree requirements
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -10,48 +11,71 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-# ============================================================================
-# VT CS DEGREE REQUIREMENTS (Hardcoded Rules)
-# ============================================================================
-
-class DegreeRequirement:
-    """VT CS BS Degree Requirements - 120 credits total"""
-
-    # Core CS courses (MUST complete all)
-    CS_CORE = ["CS 1114", "CS 2114", "CS 2505", "CS 2506", "CS 3114", "CS 3214"]
+try:
+    from degree_requirements import get_requirements
+except ImportError:
+    get_requirements = None
 
-    # Theory requirement
-    CS_THEORY = ["CS 4104"]  # Required
 
-    # Systems elective (choose 1)
-    CS_SYSTEMS_OPTIONS = ["CS 4114", "CS 4254", "CS 4284"]
+def _minor_name(minor: str) -> str:
+    """Display name for a minor code; the signup catalog loads on first use"""
+    try:
+        from catalog_display import get_minor_name
+    except ImportError:
+        return minor
+    return get_minor_name(minor) or minor
 
-    # Capstone options (choose 1)
-    CAPSTONE_OPTIONS = ["CS 4704", "CS 4784", "CS 4884", "CS 4274", "CS 4664", "CS 4094"]
 
-    # Math requirements
-    MATH_CORE = ["MATH 1225", "MATH 1226", "MATH 2114"]
-    DISCRETE_MATH = ["MATH 2534", "MATH 3034"]  # Choose 1
-
-    # Stats requirement (choose 1)
-    STATS_OPTIONS = ["STAT 4705", "STAT 4714", "STAT 3005", "STAT 3104"]
+# ============================================================================
+# VT CS DEGREE REQUIREMENTS (Hardcoded Rules)
+# ============================================================================
 
-    # Science requirements (2 sequences, typically Physics)
-    SCIENCE_SEQUENCES = {
-        "physics": ["PHYS 2305", "PHYS 2306"],
-        "chemistry": ["CHEM 1035", "CHEM 1036"],
-        "biology": ["BIOL 1105", "BIOL 1106"]
-    }
+# VT CS BS Degree Requirements - 120 credits total.
+# Requirement lists are kept as ordered tuples for display and as
+# frozensets for O(1) membership / set algebra in the progress checks.
+
+# Core CS courses (MUST complete all)
+CS_CORE_ORDERED = ("CS 1114", "CS 2114", "CS 2505", "CS 2506", "CS 3114", "CS 3214")
+CS_CORE = frozenset(CS_CORE_ORDERED)
+
+# Theory requirement
+CS_THEORY_ORDERED = ("CS 4104",)  # Required
+CS_THEORY = frozenset(CS_THEORY_ORDERED)
+
+# Systems elective (choose 1)
+CS_SYSTEMS_OPTIONS_ORDERED = ("CS 4114", "CS 4254", "CS 4284")
+CS_SYSTEMS_OPTIONS = frozenset(CS_SYSTEMS_OPTIONS_ORDERED)
+
+# Capstone options (choose 1)
+CAPSTONE_OPTIONS_ORDERED = ("CS 4704", "CS 4784", "CS 4884", "CS 4274", "CS 4664", "CS 4094")
+CAPSTONE_OPTIONS = frozenset(CAPSTONE_OPTIONS_ORDERED)
+
+# Math requirements
+MATH_CORE_ORDERED = ("MATH 1225", "MATH 1226", "MATH 2114")
+MATH_CORE = frozenset(MATH_CORE_ORDERED)
+DISCRETE_MATH_ORDERED = ("MATH 2534", "MATH 3034")  # Choose 1
+DISCRETE_MATH = frozenset(DISCRETE_MATH_ORDERED)
+
+# Stats requirement (choose 1)
+STATS_OPTIONS_ORDERED = ("STAT 4705", "STAT 4714", "STAT 3005", "STAT 3104")
+STATS_OPTIONS = frozenset(STATS_OPTIONS_ORDERED)
+
+# Science requirements (2 sequences, typically Physics)
+SCIENCE_SEQUENCES = {
+    "physics": ["PHYS 2305", "PHYS 2306"],
+    "chemistry": ["CHEM 1035", "CHEM 1036"],
+    "biology": ["BIOL 1105", "BIOL 1106"]
+}
 
-    # CS Electives requirement (minimum 3 courses, 9 credits)
-    MIN_CS_ELECTIVES = 3
+# CS Electives requirement (minimum 3 courses, 9 credits)
+MIN_CS_ELECTIVES = 3
 
-    # Total credit requirements
-    TOTAL_CREDITS = 120
-    CS_CREDITS_MIN = 45
+# Total credit requirements
+TOTAL_CREDITS = 120
+CS_CREDITS_MIN = 45
 
-    # Pathways/Gen Ed requirements
-    PATHWAY_CREDITS = 18  # 6 courses
+# Pathways/Gen Ed requirements
+PATHWAY_CREDITS = 18  # 6 courses
 
 
 # ============================================================================
@@ -102,6 +126,34 @@ PREREQUISITE_RULES = {
     "PHYS 2306": {"prereqs": ["PHYS 2305", "MATH 1226"], "min_grade": "C"},
 }
 
+# Prereq lists become frozensets so eligibility checks are a single subset test;
+# the listed order is kept separately for reporting missing prereqs
+_PREREQ_ORDER: Dict[str, Tuple[str, ...]] = {}
+for _course, _rule in PREREQUISITE_RULES.items():
+    _PREREQ_ORDER[_course] = tuple(_rule["prereqs"])
+    _rule["prereqs"] = frozenset(_rule["prereqs"])
+
+
+def _missing_prereqs(course: str, completed: set) -> List[str]:
+    """Prereqs of course not in completed, in the rule's listed order"""
+    rule = PREREQUISITE_RULES.get(course)
+    if rule is None or rule["prereqs"] <= completed:
+        return []
+    return [p for p in _PREREQ_ORDER[course] if p not in completed]
+
+
+def _ordered(ordered: tuple, subset) -> List[str]:
+    """Return the members of subset in the requirement's display order."""
+    return [c for c in ordered if c in subset] if subset else []
+
+
+def _planned_set(plan: Dict[str, List[str]]) -> set:
+    """Union of every course across the plan's semesters."""
+    planned = set()
+    for courses in plan.values():
+        planned.update(courses)
+    return planned
+
 
 # ============================================================================
 # COURSE DIFFICULTY & WORKLOAD DATA
@@ -134,9 +186,18 @@ COURSE_DIFFICULTY = {
     "CS 3724": {"difficulty": 2, "workload": 2, "notes": "HCI concepts"},
 }
 
+# Flat lookups for the per-course hot paths (default difficulty is 3)
+_DIFFICULTY_BY_COURSE: Dict[str, int] = {k: v["difficulty"] for k, v in COURSE_DIFFICULTY.items()}
+_WORKLOAD_BY_COURSE: Dict[str, int] = {k: v["workload"] for k, v in COURSE_DIFFICULTY.items()}
+# Courses rated difficulty >= 4 (unrated courses default to 3, so never hard)
+_HARD_COURSES = frozenset(k for k, v in _DIFFICULTY_BY_COURSE.items() if v >= 4)
+
 # Maximum recommended difficulty points per semester
 MAX_DIFFICULTY_PER_SEMESTER = 12  # e.g., max 2 hard courses + 2 medium
 
+# Max number of baseline analyses kept for simulate_addition
+BASELINE_CACHE_SIZE = 128
+
 
 # ============================================================================
 # CAREER PATH RECOMMENDATIONS
@@ -210,44 +271,19 @@ SEMESTER_RULES = {
     }
 }
 
+# Plan semester keys in chronological order, and their display names
+SEMESTER_ORDER = ("fall1", "spring1", "fall2", "spring2", "fall3", "spring3", "fall4", "spring4")
+_SEM_DISPLAY: Dict[str, str] = {
+    sem: sem.replace("fall", "Fall Y").replace("spring", "Spring Y") for sem in SEMESTER_ORDER
+}
+
 
 # ============================================================================
-# AI ADVISOR CLASS
+# AI PROMPT CONTEXT
 # ============================================================================
 
-class VTAdvisor:
-    """AI Academic Advisor for VT CS students"""
-
-    def __init__(self):
-        self.courses = self._load_courses()
-        self.gemini_client = None
-        self.gemini_model = None
-        self._init_gemini()
-
-    def _load_courses(self) -> Dict:
-        """Load course data from JSON file"""
-        courses_file = Path(__file__).parent / "data" / "courses.json"
-        try:
-            with open(courses_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-
-    def _init_gemini(self):
-        """Initialize Gemini AI client"""
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            try:
-                from google import genai
-                self.gemini_client = genai.Client(api_key=api_key)
-                self.gemini_model = "gemini-2.0-flash-lite"
-            except Exception as e:
-                print(f"Gemini init failed: {e}")
-                self.gemini_client = None
-
-    def _build_context(self) -> str:
-        """Build comprehensive context for AI with all rules and data"""
-        context = """
+# Static rules/data context prepended to every Gemini prompt
+_STATIC_CONTEXT = """
 # VIRGINIA TECH COMPUTER SCIENCE DEGREE REQUIREMENTS
 
 ## Core Requirements (MUST complete all):
@@ -301,76 +337,140 @@ Year 4: Capstone + electives
 4. Overloading with hard courses
 5. Not planning capstone prerequisites early enough
 """
-        return context
+
+# Full prompt skeleton, assembled once; only the per-student fields are
+# formatted in per call
+_PROMPT_TEMPLATE = _STATIC_CONTEXT.replace("{", "{{").replace("}", "}}") + """
+
+## STUDENT'S CURRENT SITUATION:
+
+{student_info}
+
+Completed courses: {completed}
+
+Planned semesters:
+{plan}
+
+Already identified issues: {issues}
+Already identified warnings: {warnings}
+
+## YOUR TASK:
+Provide personalized advice for this VT {major_name} student{with_minor}. Return JSON:
+{{
+    "suggestions": ["Specific actionable suggestion 1", "Suggestion 2", "Suggestion 3"],
+    "positives": ["Positive observation 1", "Positive observation 2"],
+    "careerAlignment": "Which career path their electives suggest",
+    "semesterTip": "Specific tip for their next semester"
+}}
+
+Focus on:
+1. What they should take next based on their progress and major/minor requirements
+2. Career-relevant elective recommendations that complement their major{and_minor}
+3. Workload balancing tips
+4. Any opportunities they might be missing
+5. {minor_focus}"""
+
+
+# ============================================================================
+# AI ADVISOR CLASS
+# ============================================================================
+
+class VTAdvisor:
+    """AI Academic Advisor for VT CS students"""
+
+    def __init__(self):
+        self.courses = self._load_courses()
+        # Flat course -> credits/name indexes for the per-semester credit sums
+        # and suggestion reasons
+        self._credits: Dict[str, int] = {
+            code: info.get("credits", 3) for code, info in self.courses.items()
+        }
+        self._course_names: Dict[str, str] = {
+            code: info.get("name", code) for code, info in self.courses.items()
+        }
+        self.gemini_client = None
+        self.gemini_model = None
+        self._baseline_cache: Dict[tuple, Dict] = {}
+        self._init_gemini()
+
+    def _load_courses(self) -> Dict:
+        """Load course data from JSON file"""
+        courses_file = Path(__file__).parent / "data" / "courses.json"
+        try:
+            with open(courses_file, 'r') as f:
+                return json.load(f)
+        except:
+            return {}
+
+    def _init_gemini(self):
+        """Initialize Gemini AI client"""
+        api_key = os.getenv("GEMINI_API_KEY")
+        if api_key:
+            try:
+                from google import genai
+                self.gemini_client = genai.Client(api_key=api_key)
+                self.gemini_model = "gemini-2.0-flash-lite"
+            except Exception as e:
+                print(f"Gemini init failed: {e}")
+                self.gemini_client = None
 
     def check_prerequisites(self, course: str, completed: set, semester_courses: set) -> Tuple[bool, List[str]]:
         """Check if prerequisites are met for a course"""
         if course not in PREREQUISITE_RULES:
             return True, []
 
-        rules = PREREQUISITE_RULES[course]
-        missing = []
-
-        for prereq in rules["prereqs"]:
-            # Prereq must be in completed, NOT in same semester
-            if prereq not in completed:
-                missing.append(prereq)
-
-        return len(missing) == 0, missing
+        # Prereqs must be in completed, NOT in same semester
+        missing = _missing_prereqs(course, completed)
+        return not missing, missing
 
     def calculate_semester_difficulty(self, courses: List[str]) -> int:
         """Calculate total difficulty score for a semester"""
-        total = 0
-        for course in courses:
-            if course in COURSE_DIFFICULTY:
-                total += COURSE_DIFFICULTY[course]["difficulty"]
-            else:
-                total += 3  # Default difficulty
-        return total
+        return sum(_DIFFICULTY_BY_COURSE.get(c, 3) for c in courses)
 
     def check_degree_progress(self, completed: List[str], planned: Dict[str, List[str]]) -> Dict:
         """Check progress toward degree completion"""
-        all_planned = set()
-        for courses in planned.values():
-            all_planned.update(courses)
+        return self._degree_progress(set(completed), _planned_set(planned))
 
-        all_courses = set(completed) | all_planned
+    def _degree_progress(self, c: set, p: set) -> Dict:
+        """check_degree_progress over prebuilt completed/planned sets"""
+        a = c | p
+        p_only = p - c
 
         progress = {
             "cs_core": {
-                "required": DegreeRequirement.CS_CORE,
-                "completed": [c for c in DegreeRequirement.CS_CORE if c in completed],
-                "planned": [c for c in DegreeRequirement.CS_CORE if c in all_planned and c not in completed],
-                "missing": [c for c in DegreeRequirement.CS_CORE if c not in all_courses]
+                "required": list(CS_CORE_ORDERED),
+                "completed": _ordered(CS_CORE_ORDERED, CS_CORE & c),
+                "planned": _ordered(CS_CORE_ORDERED, CS_CORE & p_only),
+                "missing": _ordered(CS_CORE_ORDERED, CS_CORE - a)
             },
             "theory": {
-                "required": DegreeRequirement.CS_THEORY,
-                "completed": [c for c in DegreeRequirement.CS_THEORY if c in completed],
-                "planned": [c for c in DegreeRequirement.CS_THEORY if c in all_planned],
-                "missing": [c for c in DegreeRequirement.CS_THEORY if c not in all_courses]
+                "required": list(CS_THEORY_ORDERED),
+                "completed": _ordered(CS_THEORY_ORDERED, CS_THEORY & c),
+                "planned": _ordered(CS_THEORY_ORDERED, CS_THEORY & p),
+                "missing": _ordered(CS_THEORY_ORDERED, CS_THEORY - a)
             },
             "systems_elective": {
-                "options": DegreeRequirement.CS_SYSTEMS_OPTIONS,
-                "satisfied": any(c in all_courses for c in DegreeRequirement.CS_SYSTEMS_OPTIONS),
-                "chosen": [c for c in DegreeRequirement.CS_SYSTEMS_OPTIONS if c in all_courses]
+                "options": list(CS_SYSTEMS_OPTIONS_ORDERED),
+                "satisfied": not CS_SYSTEMS_OPTIONS.isdisjoint(a),
+                "chosen": _ordered(CS_SYSTEMS_OPTIONS_ORDERED, CS_SYSTEMS_OPTIONS & a)
             },
             "capstone": {
-                "options": DegreeRequirement.CAPSTONE_OPTIONS,
-                "satisfied": any(c in all_courses for c in DegreeRequirement.CAPSTONE_OPTIONS),
-                "chosen": [c for c in DegreeRequirement.CAPSTONE_OPTIONS if c in all_courses]
+                "options": list(CAPSTONE_OPTIONS_ORDERED),
+                "satisfied": not CAPSTONE_OPTIONS.isdisjoint(a),
+                "chosen": _ordered(CAPSTONE_OPTIONS_ORDERED, CAPSTONE_OPTIONS & a)
             },
             "math_core": {
-                "required": DegreeRequirement.MATH_CORE,
-                "completed": [c for c in DegreeRequirement.MATH_CORE if c in completed],
-                "missing": [c for c in DegreeRequirement.MATH_CORE if c not in all_courses]
+                "required": list(MATH_CORE_ORDERED),
+                "completed": _ordered(MATH_CORE_ORDERED, MATH_CORE & c),
+                "missing": _ordered(MATH_CORE_ORDERED, MATH_CORE - a)
             },
             "discrete_math": {
-                "options": DegreeRequirement.DISCRETE_MATH,
-                "satisfied": any(c in all_courses for c in DegreeRequirement.DISCRETE_MATH),
+                "options": list(DISCRETE_MATH_ORDERED),
+                "satisfied": not DISCRETE_MATH.isdisjoint(a),
             },
             "stats": {
-                "options": DegreeRequirement.STATS_OPTIONS,
-                "satisfied": any(c in all_courses for c in DegreeRequirement.STATS_OPTIONS),
+                "options": list(STATS_OPTIONS_ORDERED),
+                "satisfied": not STATS_OPTIONS.isdisjoint(a),
             }
         }
 
@@ -379,97 +479,72 @@ Year 4: Capstone + electives
     def suggest_courses(self, completed: List[str], current_plan: Dict[str, List[str]],
                        career_interest: str = None) -> List[Dict]:
         """Generate smart course suggestions"""
-        suggestions = []
         completed_set = set(completed)
-        all_planned = set()
-        for courses in current_plan.values():
-            all_planned.update(courses)
+        all_planned = _planned_set(current_plan)
+        progress = self._degree_progress(completed_set, all_planned)
+        return self._suggest_courses(completed_set, all_planned, progress, career_interest)
 
+    def _suggest_courses(self, completed_set: set, all_planned: set, progress: Dict,
+                         career_interest: str = None) -> List[Dict]:
+        """suggest_courses over prebuilt sets and degree progress"""
         all_courses = completed_set | all_planned
+        course_names = self._course_names
 
-        # Check degree progress
-        progress = self.check_degree_progress(completed, current_plan)
+        # Candidate table: (course, priority, reason, set prereqs are checked against)
+        candidates = []
 
         # Priority 1: Missing core requirements
-        for core in progress["cs_core"]["missing"]:
-            # Check if prereqs are met
-            can_take, missing_prereqs = self.check_prerequisites(core, completed_set, set())
-            suggestions.append({
-                "course": core,
-                "priority": "HIGH",
-                "reason": "Required CS core course",
-                "prereqs_met": can_take,
-                "missing_prereqs": missing_prereqs
-            })
+        candidates.extend((core, "HIGH", "Required CS core course", completed_set)
+                          for core in progress["cs_core"]["missing"])
 
-        # Priority 2: Theory requirement
-        if not progress["theory"]["completed"] and not progress["theory"]["planned"]:
-            suggestions.append({
-                "course": "CS 4104",
-                "priority": "HIGH",
-                "reason": "Required theory course for graduation",
-                "prereqs_met": "CS 3114" in all_courses and "MATH 2534" in all_courses,
-                "missing_prereqs": [p for p in ["CS 3114", "MATH 2534"] if p not in all_courses]
-            })
+        # Priority 2: Theory requirement (planned prereqs count here)
+        if CS_THEORY.isdisjoint(all_courses):
+            candidates.append(("CS 4104", "HIGH", "Required theory course for graduation", all_courses))
 
         # Priority 3: Systems elective
         if not progress["systems_elective"]["satisfied"]:
-            for option in DegreeRequirement.CS_SYSTEMS_OPTIONS:
-                can_take, missing = self.check_prerequisites(option, completed_set, set())
-                suggestions.append({
-                    "course": option,
-                    "priority": "MEDIUM",
-                    "reason": f"Systems elective option - {self.courses.get(option, {}).get('name', option)}",
-                    "prereqs_met": can_take,
-                    "missing_prereqs": missing
-                })
+            candidates.extend(
+                (option, "MEDIUM", f"Systems elective option - {course_names.get(option, option)}", completed_set)
+                for option in CS_SYSTEMS_OPTIONS_ORDERED)
 
         # Priority 4: Capstone
         if not progress["capstone"]["satisfied"]:
-            for option in DegreeRequirement.CAPSTONE_OPTIONS:
-                can_take, missing = self.check_prerequisites(option, completed_set, set())
-                if option in self.courses:
-                    suggestions.append({
-                        "course": option,
-                        "priority": "MEDIUM",
-                        "reason": f"Capstone option - {self.courses.get(option, {}).get('name', option)}",
-                        "prereqs_met": can_take,
-                        "missing_prereqs": missing
-                    })
+            candidates.extend(
+                (option, "MEDIUM", f"Capstone option - {course_names[option]}", completed_set)
+                for option in CAPSTONE_OPTIONS_ORDERED
+                if option in self.courses)
 
         # Priority 5: Career-aligned electives
         if career_interest and career_interest in CAREER_PATHS:
             path = CAREER_PATHS[career_interest]
-            for course in path["recommended"]:
-                if course not in all_courses and course in self.courses:
-                    can_take, missing = self.check_prerequisites(course, completed_set, set())
-                    suggestions.append({
-                        "course": course,
-                        "priority": "LOW",
-                        "reason": f"Recommended for {path['name']} career path",
-                        "prereqs_met": can_take,
-                        "missing_prereqs": missing
-                    })
+            candidates.extend(
+                (course, "LOW", f"Recommended for {path['name']} career path", completed_set)
+                for course in path["recommended"]
+                if course not in all_courses and course in self.courses)
+
+        suggestions = []
+        for course, priority, reason, basis in candidates:
+            missing = _missing_prereqs(course, basis)
+            suggestions.append({
+                "course": course,
+                "priority": priority,
+                "reason": reason,
+                "prereqs_met": not missing,
+                "missing_prereqs": missing
+            })
 
         return suggestions
 
     async def analyze_plan(self, plan: Dict[str, List[str]], completed: List[str],
-                          in_progress: List[str] = [], major: str = "CS", minor: str = None) -> Dict:
-        """Comprehensive AI-powered plan analysis for any major/minor"""
-        # Import degree requirements for the specified major
-        try:
-            from degree_requirements import get_requirements, check_graduation_progress, SUPPORTED_MINORS
-            major_req = get_requirements(major)
-            major_name = major_req.major_name if major_req else "Computer Science"
-            # Get minor name if provided
-            minor_name = None
-            if minor:
-                minor_info = next((m for m in SUPPORTED_MINORS if m["code"] == minor), None)
-                minor_name = minor_info["name"] if minor_info else minor
-        except:
-            major_name = "Computer Science"
-            major_req = None
-            minor_name = minor
+                          in_progress: List[str] = [], major: str = "CS", minor: str = None,
+                          skip_ai: bool = False) -> Dict:
+        """Comprehensive AI-powered plan analysis for any major/minor
+
+        skip_ai=True runs only the rule-based pass (no Gemini round-trip).
+        """
+        major_req = get_requirements(major) if get_requirements else None
+        major_name = major_req.major_name if major_req else "Computer Science"
+        minor_name = _minor_name(minor) if minor else None
 
         # Rule-based analysis first
         issues = []
@@ -477,21 +552,20 @@ Year 4: Capstone + electives
         suggestions = []
         positives = []
 
-        semester_order = ["fall1", "spring1", "fall2", "spring2", "fall3", "spring3", "fall4", "spring4"]
         taken_before = set(completed + in_progress)
 
         total_planned_credits = 0
         hard_course_semesters = []
 
-        for sem in semester_order:
+        for sem in SEMESTER_ORDER:
             courses = plan.get(sem, [])
             if not courses:
                 continue
 
-            sem_credits = sum(self.courses.get(c, {}).get("credits", 3) for c in courses)
+            sem_credits = sum(self._credits.get(c, 3) for c in courses)
             total_planned_credits += sem_credits
 
-            sem_name = sem.replace("fall", "Fall Y").replace("spring", "Spring Y")
+            sem_name = _SEM_DISPLAY[sem]
 
             # Check prerequisites
             for course in courses:
@@ -506,8 +580,7 @@ Year 4: Capstone + electives
                 warnings.append(f"{sem_name}: Heavy load ({sem_credits} credits)")
 
             # Check difficulty
-            difficulty = self.calculate_semester_difficulty(courses)
-            hard_courses = [c for c in courses if COURSE_DIFFICULTY.get(c, {}).get("difficulty", 3) >= 4]
+            hard_courses = [c for c in courses if c in _HARD_COURSES]
 
             if len(hard_courses) > 2:
                 issues.append(f"{sem_name}: Too many hard courses: {', '.join(hard_courses)}")
@@ -516,7 +589,7 @@ Year 4: Capstone + electives
 
             # CS 3214 special check
             if "CS 3214" in courses:
-                other_hard = [c for c in courses if c != "CS 3214" and COURSE_DIFFICULTY.get(c, {}).get("difficulty", 3) >= 4]
+                other_hard = [c for c in hard_courses if c != "CS 3214"]
                 if other_hard:
                     issues.append(f"{sem_name}: CS 3214 should not be taken with {', '.join(other_hard)}")
                 if sem_credits > 15:
@@ -524,13 +597,15 @@ Year 4: Capstone + electives
 
             taken_before.update(courses)
 
-        # Check degree progress
-        progress = self.check_degree_progress(completed, plan)
+        # Check degree progress (sets are shared with the suggestion pass below)
+        completed_set = set(completed)
+        all_planned = _planned_set(plan)
+        progress = self._degree_progress(completed_set, all_planned)
 
         if progress["cs_core"]["missing"]:
             issues.append(f"Missing required CS core: {', '.join(progress['cs_core']['missing'])}")
 
-        if not progress["theory"]["completed"] and not progress["theory"]["planned"]:
+        if CS_THEORY.isdisjoint(completed_set) and CS_THEORY.isdisjoint(all_planned):
             warnings.append("CS 4104 (Theory) not yet planned - required for graduation")
 
         if not progress["systems_elective"]["satisfied"]:
@@ -558,9 +633,10 @@ Year 4: Capstone + electives
         base_score -= len(warnings) * 5
         base_score = max(0, min(100, base_score))
 
-        # Get AI-enhanced analysis if available
+        # Get AI-enhanced analysis if available. An empty plan (the frontend
+        # hydrating before the user adds anything) has nothing to advise on.
         ai_suggestions = []
-        if self.gemini_client:
+        if self.gemini_client and not skip_ai and any(plan.values()):
             try:
                 ai_response = await self._get_ai_suggestions(plan, completed, issues, warnings, major_name, minor_name)
                 if ai_response:
@@ -572,7 +648,7 @@ Year 4: Capstone + electives
                 print(f"AI suggestions failed: {e}")
 
         # Get rule-based suggestions
-        course_suggestions = self.suggest_courses(completed, plan)
+        course_suggestions = self._suggest_courses(completed_set, all_planned, progress)
 
         return {
             "overallScore": base_score,
@@ -592,12 +668,10 @@ Year 4: Capstone + electives
         if not self.gemini_client:
             return {}
 
-        context = self._build_context()
-
         plan_summary = []
         for sem_id, courses in plan.items():
             if courses:
-                sem_name = sem_id.replace("fall", "Fall Y").replace("spring", "Spring Y")
+                sem_name = _SEM_DISPLAY.get(sem_id) or sem_id.replace("fall", "Fall Y").replace("spring", "Spring Y")
                 plan_summary.append(f"{sem_name}: {', '.join(courses)}")
 
         # Build student info with major/minor
@@ -605,38 +679,23 @@ Year 4: Capstone + electives
         if minor_name:
             student_info += f"\nMinor: {minor_name}"
 
-        prompt = f"""{context}
-
-## STUDENT'S CURRENT SITUATION:
-
-{student_info}
-
-Completed courses: {', '.join(completed) if completed else 'None'}
-
-Planned semesters:
-{chr(10).join(plan_summary) if plan_summary else 'No courses planned yet'}
-
-Already identified issues: {'; '.join(issues) if issues else 'None'}
-Already identified warnings: {'; '.join(warnings) if warnings else 'None'}
-
-## YOUR TASK:
-Provide personalized advice for this VT {major_name} student{' with a ' + minor_name + ' minor' if minor_name else ''}. Return JSON:
-{{
-    "suggestions": ["Specific actionable suggestion 1", "Suggestion 2", "Suggestion 3"],
-    "positives": ["Positive observation 1", "Positive observation 2"],
-    "careerAlignment": "Which career path their electives suggest",
-    "semesterTip": "Specific tip for their next semester"
-}}
-
-Focus on:
-1. What they should take next based on their progress and major/minor requirements
-2. Career-relevant elective recommendations that complement their major{' and ' + minor_name + ' minor' if minor_name else ''}
-3. Workload balancing tips
-4. Any opportunities they might be missing
-5. {'Courses that would fulfill both major and minor requirements' if minor_name else 'Potential minors that complement their major'}"""
+        prompt = _PROMPT_TEMPLATE.format(
+            student_info=student_info,
+            completed=', '.join(completed) if completed else 'None',
+            plan=chr(10).join(plan_summary) if plan_summary else 'No courses planned yet',
+            issues='; '.join(issues) if issues else 'None',
+            warnings='; '.join(warnings) if warnings else 'None',
+            major_name=major_name,
+            with_minor=' with a ' + minor_name + ' minor' if minor_name else '',
+            and_minor=' and ' + minor_name + ' minor' if minor_name else '',
+            minor_focus=('Courses that would fulfill both major and minor requirements' if minor_name
+                         else 'Potential minors that complement their major'),
+        )
 
         try:
-            response = self.gemini_client.models.generate_content(
+            # Async client so the event loop keeps serving other requests
+            # (and the gathered analyses) while Gemini generates.
+            response = await self.gemini_client.aio.models.generate_content(
                 model=self.gemini_model,
                 contents=prompt,
                 config={
@@ -657,9 +716,26 @@ Focus on:
             new_plan[semester] = []
         new_plan[semester].append(course)
 
-        # Analyze both
-        current_analysis = await self.analyze_plan(current_plan, completed)
-        new_analysis = await self.analyze_plan(new_plan, completed)
+        # Score/issues/warnings are rule-based, so neither side needs the AI pass.
+        # The baseline only depends on the current plan, so reuse it across simulations.
+        key = (frozenset(completed), tuple(sorted((k, tuple(v)) for k, v in current_plan.items())))
+        current_analysis = self._baseline_cache.pop(key, None)
+        if current_analysis is None:
+            # Analyze both plans concurrently
+            current_analysis, new_analysis = await asyncio.gather(
+                self.analyze_plan(current_plan, completed, skip_ai=True),
+                self.analyze_plan(new_plan, completed, skip_ai=True),
+            )
+            if len(self._baseline_cache) >= BASELINE_CACHE_SIZE:
+                self._baseline_cache.pop(next(iter(self._baseline_cache)))
+        else:
+            new_analysis = await self.analyze_plan(new_plan, completed, skip_ai=True)
+        # Re-inserted on every use, so the cache is LRU and the plan being edited
+        # is the last to be evicted
+        self._baseline_cache[key] = current_analysis
+
+        before_issues = set(current_analysis["issues"])
+        before_warnings = set(current_analysis["warnings"])
 
         return {
             "course": course,
@@ -667,11 +743,27 @@ Focus on:
             "scoreBefore": current_analysis["overallScore"],
             "scoreAfter": new_analysis["overallScore"],
             "scoreChange": new_analysis["overallScore"] - current_analysis["overallScore"],
-            "newIssues": [i for i in new_analysis["issues"] if i not in current_analysis["issues"]],
-            "newWarnings": [w for w in new_analysis["warnings"] if w not in current_analysis["warnings"]],
+            "newIssues": [i for i in new_analysis["issues"] if i not in before_issues],
+            "newWarnings": [w for w in new_analysis["warnings"] if w not in before_warnings],
             "recommendation": "GOOD" if new_analysis["overallScore"] >= current_analysis["overallScore"] else "CAUTION"
         }
 
 
-# Singleton instance
-advisor = VTAdvisor()
+# Singleton instance, created on first use so importing the static rules
+# doesn't load the course catalog or the Gemini SDK
+_advisor: Optional[VTAdvisor] = None
+
+
+def get_advisor() -> VTAdvisor:
+    """Return the shared VTAdvisor, creating it on first call."""
+    global _advisor
+    if _advisor is None:
+        _advisor = VTAdvisor()
+    return _advisor
+
+
+def __getattr__(name: str):
+    # Keep `from ai_advisor import advisor` working for existing callers
+    if name == "advisor":
+        return get_advisor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
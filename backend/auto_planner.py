@@ -15,9 +15,11 @@ Usage:
     result = planner.generate_plan(completed=["CS 1114"], ...)
 """
 
+import heapq
 import json
-from typing import List, Dict, Set, Optional, Tuple
-from collections import defaultdict
+from bisect import bisect_left
+from typing import List, Dict, Set, Optional, Tuple, NamedTuple
+from collections import defaultdict, deque
 from models.prerequisite import evaluate_prereqs, get_all_prereq_courses, flat_prereqs_to_structured
 
 
@@ -27,6 +29,8 @@ SEMESTER_ORDER = [
     "fall3", "spring3", "fall4", "spring4"
 ]
 
+SEMESTER_INDEX = {sem: i for i, sem in enumerate(SEMESTER_ORDER)}
+
 SEMESTER_TERMS = {
     "fall1": "Fall", "spring1": "Spring",
     "fall2": "Fall", "spring2": "Spring",
@@ -34,6 +38,12 @@ SEMESTER_TERMS = {
     "fall4": "Fall", "spring4": "Spring",
 }
 
+# Term bits for offering checks; a course's mask ANDed with the semester's
+# mask is non-zero iff it is offered that term
+TERM_BITS = {"Fall": 0b01, "Spring": 0b10}
+ANY_TERM = 0b11
+SEMESTER_MASK = {sem: TERM_BITS[term] for sem, term in SEMESTER_TERMS.items()}
+
 # Career path course recommendations
 CAREER_ELECTIVES = {
     "software_engineering": {
@@ -62,6 +72,43 @@ CAREER_ELECTIVES = {
     },
 }
 
+# Recommended courses per career path, as sets for the option scoring loop
+CAREER_RECOMMENDED_SETS = {
+    path: frozenset(info["recommended"]) for path, info in CAREER_ELECTIVES.items()
+}
+
+# Most elective options considered per category (limits scoring work)
+MAX_ELECTIVE_OPTIONS = 50
+
+# Departments counted by "STEM nnnn+" elective filters
+STEM_DEPTS = frozenset({"CS", "ECE", "ME", "MATH", "STAT", "PHYS", "CHEM", "BIOL",
+                        "CMDA", "AOE", "BSE", "CEE", "CHE", "ESM", "ISE", "MSE"})
+
+# Departments whose courses count toward Pathways gen-eds
+PATHWAY_DEPTS = frozenset({"ENGL", "COMM", "PHIL", "ECON", "PSYC", "SOC", "HIST",
+                           "PSCI", "ART", "MUS", "HUM", "RLCL", "WGS"})
+
+
+def _parse_filter(filter_str: str) -> Optional[Tuple[str, int]]:
+    """Parse an elective filter like 'CS 3000+' into ('CS', 3000)."""
+    if not filter_str:
+        return None
+    parts = filter_str.split()
+    if len(parts) != 2:
+        return None
+    try:
+        return parts[0].upper(), int(parts[1].replace("+", ""))
+    except ValueError:
+        return None
+
+
+class NeededCourse(NamedTuple):
+    """A course the plan must schedule, with its ordering weight."""
+    code: str
+    priority: str
+    weight: int
+    reason: str
+
 
 class AutoPlanner:
     def __init__(self, courses_db: dict, degree_req: dict, offering_patterns: dict = None):
@@ -75,6 +122,17 @@ class AutoPlanner:
         self.courses = courses_db
         self.degree_req = degree_req
         self.offerings = offering_patterns or {}
+        # Normalized-code memo; filled on first sight of each code
+        self._norm_cache: Dict[str, str] = {}
+        # Normalized code -> (dept, number or None); filled on first sight
+        self._code_parts: Dict[str, Tuple[str, Optional[int]]] = {}
+        # Per-course offering term mask (see TERM_BITS)
+        self._offering_mask: Dict[str, int] = {}
+        # Per-course prerequisite codes, raw and normalized
+        self._prereq_cache: Dict[str, Tuple[str, ...]] = {}
+        self._prereq_norm_cache: Dict[str, Tuple[str, ...]] = {}
+        # dept -> (levels, codes) sorted by level; built on first elective lookup
+        self._by_dept_level: Optional[Dict[str, Tuple[List[int], List[str]]]] = None
 
     def generate_plan(
         self,
@@ -96,35 +154,36 @@ class AutoPlanner:
                 "unplaced": ["CS 4104"]
             }
         """
-        completed = set(completed or [])
-        in_progress = set(in_progress or [])
+        done = set(completed or []) | set(in_progress or [])
+        done_normalized = self._normalize_set(done)
         preferences = preferences or {}
 
         # Determine active semesters
-        start_idx = SEMESTER_ORDER.index(start_semester) if start_semester in SEMESTER_ORDER else 0
+        start_idx = SEMESTER_INDEX.get(start_semester, 0)
         active_semesters = SEMESTER_ORDER[start_idx:start_idx + remaining_semesters]
 
         # Step 1: Determine what courses are needed
-        needed = self._compute_needed_courses(completed, in_progress, career_path, priority)
+        needed = self._compute_needed_courses(done_normalized, career_path, priority)
 
         # Step 2: Build prerequisite DAG
-        dag, all_needed_codes = self._build_prereq_dag(needed, completed | in_progress)
+        dag, reverse_dag, all_needed_codes = self._build_prereq_dag(needed, done_normalized)
 
         # Step 3: Topological sort with priority weights
-        sorted_courses = self._prioritized_topological_sort(dag, all_needed_codes, needed)
+        sorted_courses = self._prioritized_topological_sort(dag, reverse_dag, all_needed_codes, needed)
 
         # Step 4: Schedule into semesters
         max_credits = preferences.get("max_credits", 16 if priority == "maximize_gpa" else 18)
         max_difficulty = preferences.get("max_difficulty_score", 12 if priority == "maximize_gpa" else 16)
         balanced = preferences.get("balanced", priority == "maximize_gpa")
 
-        schedule, unplaced = self._schedule_courses(
-            sorted_courses, completed, in_progress,
+        schedule, unplaced, sem_credits, sem_hard_count = self._schedule_courses(
+            sorted_courses, done_normalized,
             active_semesters, max_credits, max_difficulty, balanced
         )
 
         # Step 5: Optimization pass
-        schedule = self._optimize(schedule, priority, career_path, balanced)
+        schedule = self._optimize(schedule, priority, career_path, balanced,
+                                  sem_credits, sem_hard_count)
 
         # Build metadata
         total_credits = 0
@@ -134,7 +193,7 @@ class AutoPlanner:
                 total_credits += self._get_credits(code)
                 courses_placed += 1
 
-        existing_credits = sum(self._get_credits(c) for c in completed | in_progress)
+        existing_credits = sum(self._get_credits(c) for c in done)
 
         warnings = []
         if unplaced:
@@ -165,32 +224,24 @@ class AutoPlanner:
         }
 
     def _compute_needed_courses(
-        self, completed: Set[str], in_progress: Set[str],
+        self, all_done: Set[str],
         career_path: str = None, priority: str = "on_time"
-    ) -> List[dict]:
-        """Determine all courses a student still needs."""
-        all_done = self._normalize_set(completed | in_progress)
+    ) -> List["NeededCourse"]:
+        """Determine all courses a student still needs.
+
+        all_done holds the normalized codes of completed + in-progress courses.
+        """
         needed = []
 
         # Core courses
         for course in self.degree_req.get("core_courses", []):
             if self._normalize(course) not in all_done:
-                needed.append({
-                    "code": course,
-                    "priority": "REQUIRED",
-                    "weight": 100,
-                    "reason": "core_requirement"
-                })
+                needed.append(NeededCourse(course, "REQUIRED", 100, "core_requirement"))
 
         # Math requirements
         for course in self.degree_req.get("math_requirements", []):
             if self._normalize(course) not in all_done:
-                needed.append({
-                    "code": course,
-                    "priority": "REQUIRED",
-                    "weight": 95,
-                    "reason": "math_requirement"
-                })
+                needed.append(NeededCourse(course, "REQUIRED", 95, "math_requirement"))
 
         # Choice requirements - pick best option
         for choice_name, choice_info in self.degree_req.get("choice_requirements", {}).items():
@@ -203,12 +254,7 @@ class AutoPlanner:
                 available_opts = [opt for opt in options if self._normalize(opt) not in all_done]
                 selected = self._pick_best_options(available_opts, remaining_pick, career_path, priority)
                 for course in selected:
-                    needed.append({
-                        "code": course,
-                        "priority": "REQUIRED",
-                        "weight": 90,
-                        "reason": f"choice_{choice_name}"
-                    })
+                    needed.append(NeededCourse(course, "REQUIRED", 90, f"choice_{choice_name}"))
 
         # Science requirements
         science_req = self.degree_req.get("science_requirements", {})
@@ -224,40 +270,27 @@ class AutoPlanner:
                 if best_seq:
                     for course in best_seq["courses"]:
                         if self._normalize(course) not in all_done:
-                            needed.append({
-                                "code": course,
-                                "priority": "REQUIRED",
-                                "weight": 85,
-                                "reason": "science_sequence"
-                            })
+                            needed.append(NeededCourse(course, "REQUIRED", 85, "science_sequence"))
         if "required" in science_req:
             for seq in science_req["required"]:
                 for course in seq["courses"]:
                     if self._normalize(course) not in all_done:
-                        needed.append({
-                            "code": course,
-                            "priority": "REQUIRED",
-                            "weight": 85,
-                            "reason": "science_required"
-                        })
+                        needed.append(NeededCourse(course, "REQUIRED", 85, "science_required"))
 
         # Elective requirements
-        for cat, req_info in self.degree_req.get("elective_requirements", {}).items():
+        elective_reqs = self.degree_req.get("elective_requirements", {})
+        done_levels = self._levels_by_dept(all_done) if elective_reqs else {}
+        for cat, req_info in elective_reqs.items():
             min_courses = req_info.get("min_courses", 0)
             filter_str = req_info.get("filter", "")
-            current_count = self._count_matching(all_done, filter_str)
+            current_count = self._count_matching(done_levels, filter_str)
 
             if current_count < min_courses:
                 remaining = min_courses - current_count
                 options = self._get_elective_options(filter_str, all_done)
                 selected = self._pick_best_options(options, remaining, career_path, priority)
                 for course in selected:
-                    needed.append({
-                        "code": course,
-                        "priority": "ELECTIVE",
-                        "weight": 50,
-                        "reason": f"elective_{cat}"
-                    })
+                    needed.append(NeededCourse(course, "ELECTIVE", 50, f"elective_{cat}"))
 
         # Add pathways/gen-ed placeholders if needed
         pathways_credits = self.degree_req.get("pathways_credits", 0)
@@ -265,242 +298,236 @@ class AutoPlanner:
             pathways_done = self._count_pathways(all_done)
             remaining_pathways = (pathways_credits - pathways_done) // 3
             for i in range(max(0, remaining_pathways)):
-                needed.append({
-                    "code": f"Pathway {i+1}",
-                    "priority": "PATHWAY",
-                    "weight": 30,
-                    "reason": "pathways"
-                })
+                needed.append(NeededCourse(f"Pathway {i+1}", "PATHWAY", 30, "pathways"))
 
-        return needed
+        # A course can satisfy several requirements (e.g. a choice option that
+        # is also a recommended elective); keep its highest-weight record
+        best: Dict[str, NeededCourse] = {}
+        for n in needed:
+            if n.code not in best or n.weight > best[n.code].weight:
+                best[n.code] = n
+        return list(best.values())
 
     def _build_prereq_dag(
-        self, needed: List[dict], already_done: Set[str]
-    ) -> Tuple[Dict[str, Set[str]], Set[str]]:
-        """Build prerequisite DAG, including transitive prereqs."""
-        done_normalized = self._normalize_set(already_done)
+        self, needed: List[NeededCourse], done_normalized: Set[str]
+    ) -> Tuple[Dict[str, Set[str]], Dict[str, List[str]], Set[str]]:
+        """Build prerequisite DAG, including transitive prereqs.
+
+        Returns (dag, reverse_dag, all_codes) where dag maps course -> prereqs
+        and reverse_dag maps prereq -> courses that depend on it.
+        """
         dag = {}
+        reverse_dag = defaultdict(list)
         all_codes = set()
-        to_process = [n["code"] for n in needed if not n["code"].startswith("Pathway")]
+        to_process = deque(n.code for n in needed if not n.code.startswith("Pathway"))
         processed = set()
 
         while to_process:
-            code = to_process.pop(0)
+            code = to_process.popleft()
             if code in processed or self._normalize(code) in done_normalized:
                 continue
             processed.add(code)
             all_codes.add(code)
 
-            prereqs = self._get_prereq_courses(code)
-            dag[code] = set()
-            for prereq in prereqs:
-                if self._normalize(prereq) not in done_normalized:
-                    dag[code].add(prereq)
-                    if prereq not in processed:
-                        to_process.append(prereq)
+            # Direct prereqs still outstanding; the walk stops at completed
+            # courses, so their own prereqs are never pulled into the plan
+            pending = {prereq for prereq, norm in zip(self._get_prereq_courses(code),
+                                                      self._get_prereq_norms(code))
+                       if norm not in done_normalized}
+            dag[code] = pending
+            for prereq in pending:
+                reverse_dag[prereq].append(code)
+                if prereq not in processed:
+                    to_process.append(prereq)
 
-        return dag, all_codes
+        return dag, reverse_dag, all_codes
 
     def _prioritized_topological_sort(
-        self, dag: Dict[str, Set[str]], all_codes: Set[str],
-        needed: List[dict]
-    ) -> List[dict]:
+        self, dag: Dict[str, Set[str]], reverse_dag: Dict[str, List[str]],
+        all_codes: Set[str], needed: List[NeededCourse]
+    ) -> List[NeededCourse]:
         """Topological sort with priority weights for scheduling order."""
-        # Build weight map from needed list
-        weight_map = {}
-        reason_map = {}
-        for n in needed:
-            if n["code"] not in weight_map or n["weight"] > weight_map[n["code"]]:
-                weight_map[n["code"]] = n["weight"]
-                reason_map[n["code"]] = n.get("reason", "")
+        # needed is already one record per code
+        records = {n.code: n for n in needed}
 
         # Add implicit prereqs that aren't in needed but are in the DAG
         for code in all_codes:
-            if code not in weight_map:
-                weight_map[code] = 80  # Transitive prereqs are important
-                reason_map[code] = "transitive_prereq"
+            if code not in records:
+                # Transitive prereqs are important
+                records[code] = NeededCourse(code, "REQUIRED", 80, "transitive_prereq")
 
-        # Kahn's algorithm with priority queue
-        in_degree = defaultdict(int)
-        for code in all_codes:
-            if code not in in_degree:
-                in_degree[code] = 0
-            for prereq in dag.get(code, set()):
-                in_degree[prereq]  # Ensure exists
+        # Kahn's algorithm with a max-weight heap. Among equal weights, courses
+        # that unlock more of the plan go first, then by code for determinism.
+        # Heap keys are built once per course; pushes just reuse them.
+        rank = {code: (-records[code].weight, -len(reverse_dag.get(code, ())), code)
+                for code in all_codes}
 
-        for code, prereqs in dag.items():
-            for prereq in prereqs:
-                in_degree[code] += 1  # This is wrong direction, let me fix
-
-        # Rebuild in_degree correctly
-        in_degree = defaultdict(int)
-        for code in all_codes:
-            in_degree[code] = 0
-        for code, prereqs in dag.items():
-            in_degree[code] = len(prereqs)
-
-        # Start with courses that have no unmet prereqs
-        ready = []
-        for code in all_codes:
-            if in_degree[code] == 0:
-                ready.append(code)
-
-        # Sort ready by weight (highest first)
-        ready.sort(key=lambda c: -weight_map.get(c, 0))
+        in_degree = {code: len(dag.get(code, ())) for code in all_codes}
+        ready = [rank[code] for code in all_codes if in_degree[code] == 0]
+        heapq.heapify(ready)
 
         result = []
-        placed = set()
 
         while ready:
             # Pick highest priority course
-            code = ready.pop(0)
-            if code in placed:
-                continue
-            placed.add(code)
-
-            result.append({
-                "code": code,
-                "weight": weight_map.get(code, 0),
-                "reason": reason_map.get(code, ""),
-            })
-
-            # Update in-degrees
-            for other_code in all_codes:
-                if code in dag.get(other_code, set()):
-                    in_degree[other_code] -= 1
-                    if in_degree[other_code] <= 0 and other_code not in placed:
-                        ready.append(other_code)
+            code = heapq.heappop(ready)[-1]
+            result.append(records[code])
 
-            ready.sort(key=lambda c: -weight_map.get(c, 0))
+            # Only the courses that depend on this one can become ready
+            for dependent in reverse_dag.get(code, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, rank[dependent])
 
         # Add pathway placeholders at the end
         for n in needed:
-            if n["code"].startswith("Pathway"):
+            if n.code.startswith("Pathway"):
                 result.append(n)
 
         return result
 
     def _schedule_courses(
-        self, sorted_courses: List[dict], completed: Set[str],
-        in_progress: Set[str], active_semesters: List[str],
+        self, sorted_courses: List[NeededCourse], done_normalized: Set[str],
+        active_semesters: List[str],
         max_credits: int, max_difficulty: int, balanced: bool
-    ) -> Tuple[Dict[str, List[str]], List[str]]:
-        """Place courses into semester slots respecting constraints."""
+    ) -> Tuple[Dict[str, List[str]], List[str], Dict[str, int], Dict[str, int]]:
+        """Place courses into semester slots respecting constraints.
+
+        Returns (schedule, unplaced, sem_credits, sem_hard_count); the last two
+        are the running per-semester totals, for the optimization pass.
+        """
         schedule = {sem: [] for sem in active_semesters}
-        placed = self._normalize_set(completed | in_progress)
-        placed_codes = set(completed | in_progress)
+        # Normalized code -> index of the semester it lands in (-1 = already done)
+        placed_in_sem = dict.fromkeys(done_normalized, -1)
         unplaced = []
 
+        # Running per-semester totals, updated as courses are placed
+        sem_credits = {sem: 0 for sem in active_semesters}
+        sem_difficulty = {sem: 0 for sem in active_semesters}
+        sem_hard_count = {sem: 0 for sem in active_semesters}
+
         for course_info in sorted_courses:
-            code = course_info["code"]
-            if self._normalize(code) in placed:
+            code = course_info.code
+            norm = self._normalize(code)
+            if norm in placed_in_sem:
                 continue
 
+            # Resolve the course's numbers once, not per candidate semester
+            credits = self._get_credits(code)
+            difficulty = self._get_difficulty(code)
+
             # Try each semester in order
             course_placed = False
             for sem_id in active_semesters:
-                if self._can_place(code, sem_id, schedule, placed_codes,
+                if self._can_place(code, credits, difficulty, sem_id, placed_in_sem,
+                                   sem_credits, sem_difficulty, sem_hard_count,
                                    max_credits, max_difficulty, balanced):
                     schedule[sem_id].append(code)
-                    placed.add(self._normalize(code))
-                    placed_codes.add(code)
+                    placed_in_sem[norm] = SEMESTER_INDEX[sem_id]
+                    sem_credits[sem_id] += credits
+                    sem_difficulty[sem_id] += difficulty
+                    if difficulty >= 4:
+                        sem_hard_count[sem_id] += 1
                     course_placed = True
                     break
 
             if not course_placed:
                 unplaced.append(code)
 
-        return schedule, unplaced
+        return schedule, unplaced, sem_credits, sem_hard_count
 
     def _can_place(
-        self, code: str, sem_id: str, schedule: dict,
-        placed_codes: Set[str], max_credits: int,
+        self, code: str, course_credits: int, course_difficulty: int,
+        sem_id: str, placed_in_sem: Dict[str, int],
+        sem_credits: Dict[str, int], sem_difficulty: Dict[str, int],
+        sem_hard_count: Dict[str, int], max_credits: int,
         max_difficulty: int, balanced: bool
     ) -> bool:
         """Check if a course can be placed in a given semester."""
         # Skip pathway placeholders - they can go anywhere
         if code.startswith("Pathway"):
             # Check credit limit
-            current_credits = sum(self._get_credits(c) for c in schedule[sem_id])
-            return current_credits + 3 <= max_credits
+            return sem_credits[sem_id] + 3 <= max_credits
 
-        # Check course offering pattern
-        term = SEMESTER_TERMS.get(sem_id, "Fall")
-        offered = self._get_offerings(code)
-        if offered and term not in offered:
-            return False
-
-        # Check prerequisites are satisfied BEFORE this semester
-        # Build set of only courses completed or placed in EARLIER semesters
-        sem_idx = SEMESTER_ORDER.index(sem_id) if sem_id in SEMESTER_ORDER else 0
-        available_before = set(placed_codes)
-        # Remove courses placed in current or later semesters
-        for later_sem in SEMESTER_ORDER[sem_idx:]:
-            if later_sem in schedule:
-                for c in schedule[later_sem]:
-                    available_before.discard(c)
-
-        prereqs = self._get_prereq_courses(code)
-        for prereq in prereqs:
-            if self._normalize(prereq) not in self._normalize_set(available_before):
-                return False
+        # Cheap integer checks first; most rejections happen on a full semester
 
         # Check credit limit
-        current_credits = sum(self._get_credits(c) for c in schedule[sem_id])
-        course_credits = self._get_credits(code)
-        if current_credits + course_credits > max_credits:
+        if sem_credits[sem_id] + course_credits > max_credits:
             return False
 
         # Check difficulty balance
-        current_difficulty = sum(self._get_difficulty(c) for c in schedule[sem_id])
-        course_difficulty = self._get_difficulty(code)
-        if current_difficulty + course_difficulty > max_difficulty:
+        if sem_difficulty[sem_id] + course_difficulty > max_difficulty:
             return False
 
         # Check max hard courses (difficulty >= 4)
-        if balanced and course_difficulty >= 4:
-            hard_count = sum(1 for c in schedule[sem_id] if self._get_difficulty(c) >= 4)
-            if hard_count >= 2:
+        if balanced and course_difficulty >= 4 and sem_hard_count[sem_id] >= 2:
+            return False
+
+        # Check course offering pattern
+        if not (self._get_offering_mask(code) & SEMESTER_MASK.get(sem_id, TERM_BITS["Fall"])):
+            return False
+
+        # Check prerequisites are satisfied BEFORE this semester: each must be
+        # already done or placed in a strictly earlier semester
+        sem_idx = SEMESTER_INDEX.get(sem_id, 0)
+        for prereq in self._get_prereq_norms(code):
+            if placed_in_sem.get(prereq, sem_idx) >= sem_idx:
                 return False
 
         return True
 
     def _optimize(
         self, schedule: dict, priority: str,
-        career_path: str = None, balanced: bool = False
+        career_path: str = None, balanced: bool = False,
+        sem_credits: Dict[str, int] = None, sem_hard_count: Dict[str, int] = None
     ) -> dict:
         """Post-processing optimization pass."""
         if priority == "maximize_gpa":
-            schedule = self._balance_difficulty(schedule)
+            schedule = self._balance_difficulty(schedule, sem_credits, sem_hard_count)
         elif priority == "on_time":
             schedule = self._front_load_prereqs(schedule)
         return schedule
 
-    def _balance_difficulty(self, schedule: dict) -> dict:
-        """Spread hard courses more evenly across semesters."""
+    def _balance_difficulty(
+        self, schedule: dict,
+        sem_credits: Dict[str, int] = None, sem_hard_count: Dict[str, int] = None
+    ) -> dict:
+        """Spread hard courses more evenly across semesters.
+
+        sem_credits / sem_hard_count are the scheduler's running totals; they
+        are computed here if not supplied, and kept in step with each move.
+        """
+        if sem_credits is None:
+            sem_credits = {sem: sum(self._get_credits(c) for c in courses)
+                           for sem, courses in schedule.items()}
+        if sem_hard_count is None:
+            sem_hard_count = {sem: sum(1 for c in courses if self._get_difficulty(c) >= 4)
+                              for sem, courses in schedule.items()}
+
         # Find semesters with multiple hard courses
         for sem_id, courses in schedule.items():
-            hard = [c for c in courses if self._get_difficulty(c) >= 4]
-            if len(hard) <= 2:
+            if sem_hard_count[sem_id] <= 2:
                 continue
+            hard = [c for c in courses if self._get_difficulty(c) >= 4]
 
             # Try to move extra hard courses to adjacent semesters
-            sem_idx = SEMESTER_ORDER.index(sem_id) if sem_id in SEMESTER_ORDER else -1
+            sem_idx = SEMESTER_INDEX.get(sem_id, -1)
             for excess_course in hard[2:]:
+                credits = self._get_credits(excess_course)
                 # Try next semesters
                 for offset in [1, -1, 2, -2]:
                     target_idx = sem_idx + offset
                     if 0 <= target_idx < len(SEMESTER_ORDER):
                         target_sem = SEMESTER_ORDER[target_idx]
-                        if target_sem in schedule:
-                            target_hard = sum(1 for c in schedule[target_sem]
-                                              if self._get_difficulty(c) >= 4)
-                            target_credits = sum(self._get_credits(c)
-                                                 for c in schedule[target_sem])
-                            if target_hard < 2 and target_credits + self._get_credits(excess_course) <= 18:
-                                schedule[sem_id].remove(excess_course)
-                                schedule[target_sem].append(excess_course)
-                                break
+                        if (target_sem in schedule and sem_hard_count[target_sem] < 2
+                                and sem_credits[target_sem] + credits <= 18):
+                            schedule[sem_id].remove(excess_course)
+                            schedule[target_sem].append(excess_course)
+                            sem_hard_count[sem_id] -= 1
+                            sem_hard_count[target_sem] += 1
+                            sem_credits[sem_id] -= credits
+                            sem_credits[target_sem] += credits
+                            break
         return schedule
 
     def _front_load_prereqs(self, schedule: dict) -> dict:
@@ -511,7 +538,10 @@ class AutoPlanner:
     # --- Helper methods ---
 
     def _normalize(self, code: str) -> str:
-        return code.upper().replace(" ", "").replace("-", "")
+        norm = self._norm_cache.get(code)
+        if norm is None:
+            norm = self._norm_cache[code] = code.upper().replace(" ", "").replace("-", "")
+        return norm
 
     def _normalize_set(self, codes) -> Set[str]:
         return {self._normalize(c) for c in codes}
@@ -540,17 +570,41 @@ class AutoPlanner:
         info = self.courses.get(code, {})
         return info.get("typically_offered", [])
 
-    def _get_prereq_courses(self, code: str) -> List[str]:
-        """Get flat list of prerequisite course codes."""
-        info = self.courses.get(code, {})
-
-        # Try structured prereqs first
-        structured = info.get("prereqs_structured")
-        if structured:
-            return get_all_prereq_courses(structured)
-
-        # Fall back to flat list
-        return info.get("prereqs", [])
+    def _get_offering_mask(self, code: str) -> int:
+        """Term bitmask for a course (memoized); unlisted courses run every term."""
+        mask = self._offering_mask.get(code)
+        if mask is None:
+            offered = self._get_offerings(code)
+            if offered:
+                mask = 0
+                for term in offered:
+                    mask |= TERM_BITS.get(term, 0)
+            else:
+                mask = ANY_TERM
+            self._offering_mask[code] = mask
+        return mask
+
+    def _get_prereq_courses(self, code: str) -> Tuple[str, ...]:
+        """Get flat tuple of prerequisite course codes (memoized)."""
+        prereqs = self._prereq_cache.get(code)
+        if prereqs is None:
+            info = self.courses.get(code, {})
+            # Try structured prereqs first, then fall back to flat list
+            structured = info.get("prereqs_structured")
+            if structured:
+                prereqs = tuple(get_all_prereq_courses(structured))
+            else:
+                prereqs = tuple(info.get("prereqs", []))
+            self._prereq_cache[code] = prereqs
+        return prereqs
+
+    def _get_prereq_norms(self, code: str) -> Tuple[str, ...]:
+        """Normalized prerequisite codes for a course (memoized)."""
+        norms = self._prereq_norm_cache.get(code)
+        if norms is None:
+            norms = self._prereq_norm_cache[code] = tuple(
+                self._normalize(p) for p in self._get_prereq_courses(code))
+        return norms
 
     def _pick_best_options(
         self, options: List[str], pick: int,
@@ -560,31 +614,24 @@ class AutoPlanner:
         if not options:
             return []
 
-        scored = []
-        for code in options:
-            score = 0
-            info = self.courses.get(code, {})
+        recommended = CAREER_RECOMMENDED_SETS.get(career_path) if career_path else None
+        prefer_easy = priority == "maximize_gpa"
 
+        def score(code: str) -> int:
+            value = 0
             # Career alignment bonus
-            if career_path and career_path in CAREER_ELECTIVES:
-                if code in CAREER_ELECTIVES[career_path]["recommended"]:
-                    score += 20
-
-            # Difficulty preference
-            difficulty = self._get_difficulty(code)
-            if priority == "maximize_gpa":
-                score -= difficulty * 3  # Prefer easier courses
-            elif priority == "on_time":
-                score += 5  # Neutral
-
+            if recommended and code in recommended:
+                value += 20
+            # Difficulty preference: prefer easier courses when maximizing GPA
+            if prefer_easy:
+                value -= self._get_difficulty(code) * 3
             # Prefer courses with fewer prereqs (easier to schedule)
-            prereqs = len(info.get("prereqs", []))
-            score -= prereqs * 2
+            value -= len(self.courses.get(code, {}).get("prereqs", [])) * 2
+            return value
 
-            scored.append((score, code))
-
-        scored.sort(key=lambda x: -x[0])
-        return [code for _, code in scored[:pick]]
+        # Partial selection of the top `pick`; ties keep input order,
+        # exactly as a stable full sort would
+        return heapq.nlargest(pick, options, key=score)
 
     def _pick_best_sequence(self, sequences: list, done_normalized: Set[str]) -> dict:
         """Pick the science sequence with most partial progress."""
@@ -599,103 +646,97 @@ class AutoPlanner:
 
         return best or (sequences[0] if sequences else None)
 
-    def _count_matching(self, done_normalized: Set[str], filter_str: str) -> int:
+    def _levels_by_dept(self, done_normalized: Set[str]) -> Dict[str, List[int]]:
+        """Group completed course numbers by department, sorted, for _count_matching."""
+        levels = defaultdict(list)
+        for code in done_normalized:
+            dept, num = self._split_code(code)
+            if dept and num is not None:
+                levels[dept].append(num)
+        for nums in levels.values():
+            nums.sort()
+        return levels
+
+    def _count_matching(self, done_levels: Dict[str, List[int]], filter_str: str) -> int:
         """Count courses matching a filter like 'CS 3000+'."""
-        if not filter_str:
+        parsed = _parse_filter(filter_str)
+        if not parsed:
             return 0
+        dept_filter, min_level = parsed
 
-        parts = filter_str.split()
-        if len(parts) != 2:
-            return 0
-
-        dept_filter = parts[0].upper()
-        level_str = parts[1].replace("+", "")
-        try:
-            min_level = int(level_str)
-        except ValueError:
-            return 0
-
-        stem_depts = {"CS", "ECE", "ME", "MATH", "STAT", "PHYS", "CHEM", "BIOL",
-                      "CMDA", "AOE", "BSE", "CEE", "CHE", "ESM", "ISE", "MSE"}
-
+        depts = STEM_DEPTS if dept_filter == "STEM" else (dept_filter,)
         count = 0
-        for code in done_normalized:
-            dept = ""
-            num_str = ""
-            for i, ch in enumerate(code):
-                if ch.isdigit():
-                    dept = code[:i]
-                    num_str = code[i:]
-                    break
-            if not dept:
-                continue
-            try:
-                num = int(num_str)
-            except ValueError:
-                continue
-
-            if dept_filter == "STEM":
-                if dept in stem_depts and num >= min_level:
-                    count += 1
-            elif dept == dept_filter and num >= min_level:
-                count += 1
-
+        for dept in depts:
+            nums = done_levels.get(dept)
+            if nums:
+                count += len(nums) - bisect_left(nums, min_level)
         return count
 
     def _get_elective_options(self, filter_str: str, done_normalized: Set[str]) -> List[str]:
         """Get available elective courses matching a filter."""
-        if not filter_str:
-            return []
-
-        parts = filter_str.split()
-        if len(parts) != 2:
-            return []
-
-        dept_filter = parts[0].upper()
-        level_str = parts[1].replace("+", "")
-        try:
-            min_level = int(level_str)
-        except ValueError:
+        parsed = _parse_filter(filter_str)
+        if not parsed:
             return []
+        dept_filter, min_level = parsed
 
-        stem_depts = {"CS", "ECE", "ME", "MATH", "STAT", "PHYS", "CHEM", "BIOL",
-                      "CMDA", "AOE", "BSE", "CEE", "CHE", "ESM", "ISE", "MSE"}
+        index = self._dept_index()
+        if dept_filter == "STEM":
+            depts = [d for d in index if d in STEM_DEPTS]
+        else:
+            depts = [dept_filter]
 
+        # Walk the level-sorted index from min_level and stop at the cap,
+        # rather than collecting every match and truncating
         options = []
-        for code in self.courses:
-            norm = self._normalize(code)
-            if norm in done_normalized:
-                continue
-
-            parts_code = code.split()
-            if len(parts_code) != 2:
-                continue
-
-            dept = parts_code[0]
-            try:
-                num = int(parts_code[1])
-            except ValueError:
+        for dept in depts:
+            if dept not in index:
                 continue
-
-            if dept_filter == "STEM":
-                if dept in stem_depts and num >= min_level:
+            levels, codes = index[dept]
+            for i in range(bisect_left(levels, min_level), len(codes)):
+                code = codes[i]
+                if self._normalize(code) not in done_normalized:
                     options.append(code)
-            elif dept == dept_filter and num >= min_level:
-                options.append(code)
+                    if len(options) == MAX_ELECTIVE_OPTIONS:
+                        return options
 
-        return options[:50]  # Limit to prevent explosion
+        return options
 
     def _count_pathways(self, done_normalized: Set[str]) -> int:
         """Estimate pathways credits completed."""
-        pathway_depts = {"ENGL", "COMM", "PHIL", "ECON", "PSYC", "SOC", "HIST",
-                         "PSCI", "ART", "MUS", "HUM", "RLCL", "WGS"}
-        count = 0
-        for code in done_normalized:
-            dept = ""
-            for i, ch in enumerate(code):
+        return 3 * sum(1 for code in done_normalized
+                       if self._split_code(code)[0] in PATHWAY_DEPTS)
+
+    def _split_code(self, norm: str) -> Tuple[str, Optional[int]]:
+        """Split a normalized code like 'CS3114' into ('CS', 3114), memoized."""
+        parts = self._code_parts.get(norm)
+        if parts is None:
+            dept, num = "", None
+            for i, ch in enumerate(norm):
                 if ch.isdigit():
-                    dept = code[:i]
+                    dept = norm[:i]
+                    try:
+                        num = int(norm[i:])
+                    except ValueError:
+                        pass
                     break
-            if dept in pathway_depts:
-                count += 3
-        return count
+            parts = self._code_parts[norm] = (dept, num)
+        return parts
+
+    def _dept_index(self) -> Dict[str, Tuple[List[int], List[str]]]:
+        """Per-department course lists sorted by level, for bisecting on min level."""
+        if self._by_dept_level is None:
+            by_dept = defaultdict(list)
+            for code in self.courses:
+                parts = code.split()
+                if len(parts) != 2:
+                    continue
+                try:
+                    by_dept[parts[0]].append((int(parts[1]), code))
+                except ValueError:
+                    continue
+            self._by_dept_level = {}
+            for dept, entries in by_dept.items():
+                entries.sort(key=lambda e: e[0])
+                self._by_dept_level[dept] = ([lvl for lvl, _ in entries],
+                                             [code for _, code in entries])
+        return self._by_dept_level
@@ -0,0 +1,737 @@
+"""
+VT Catalog Display Data
+=======================
+Supported majors, minors and concentrations for the signup and profile forms.
+Kept out of degree_requirements so workers that only run audits never load it.
+"""
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+
+class College(StrEnum):
+    """Colleges used to group SUPPORTED_MAJORS (values are the display labels)"""
+    PAMPLIN = "Pamplin"
+    ENGINEERING = "Engineering"
+    SCIENCE = "Science"
+    LIBERAL_ARTS = "Liberal Arts"
+    AGRICULTURE = "Agriculture"
+    ARCHITECTURE = "Architecture"
+    NATURAL_RESOURCES = "Natural Resources"
+    HEALTH_SCIENCES = "Health Sciences"
+    EDUCATION = "Education"
+    OTHER = "Other"
+    GENERAL = "General"
+
+
+@dataclass(frozen=True, slots=True)
+class Major:
+    """A supported major as listed on the signup form"""
+    code: str
+    name: str
+    college: College
+
+    def to_dict(self) -> dict:
+        return {"code": self.code, "name": self.name, "college": self.college}
+
+
+@dataclass(frozen=True, slots=True)
+class Minor:
+    """A supported minor as listed on the signup form"""
+    code: str
+    name: str
+
+    def to_dict(self) -> dict:
+        return {"code": self.code, "name": self.name}
+
+
+@dataclass(frozen=True, slots=True)
+class Concentration:
+    """A concentration/option within a major"""
+    code: str
+    name: str
+
+    def to_dict(self) -> dict:
+        return {"code": self.code, "name": self.name}
+
+
+# =============================================================================
+# CATALOG TABLES
+# =============================================================================
+
+# The tables and their indexes resolve through the module __getattr__ and are
+# built on first access.
+
+def _load_supported_majors() -> Tuple[Major, ...]:
+    """All supported majors for the signup form (sourced from VT catalog)"""
+    return (
+        # Pamplin College of Business
+        Major("ACBA", "Accounting & Business Analysis", College.PAMPLIN),
+        Major("ACIS", "Accounting and Information Systems", College.PAMPLIN),
+        Major("BIT", "Business Information Technology", College.PAMPLIN),
+        Major("CYMA", "Cybersecurity Management and Analytics", College.PAMPLIN),
+        Major("EITM", "Entrepreneurship, Innovation & Technology Management", College.PAMPLIN),
+        Major("FIN", "Finance", College.PAMPLIN),
+        Major("FPWM", "Financial Planning and Wealth Management", College.PAMPLIN),
+        Major("FTBD", "FinTech and Big Data Analytics", College.PAMPLIN),
+        Major("HRM", "Human Resource Management", College.PAMPLIN),
+        Major("HTM", "Hospitality and Tourism Management", College.PAMPLIN),
+        Major("MCA", "Management Consulting and Analytics", College.PAMPLIN),
+        Major("MGT", "Management", College.PAMPLIN),
+        Major("MKTG", "Marketing Management", College.PAMPLIN),
+        Major("PM", "Property Management", College.PAMPLIN),
+        Major("RECP", "Real Estate for Commercial Properties", College.PAMPLIN),
+        Major("RERP", "Real Estate for Residential Properties", College.PAMPLIN),
+
+        # College of Engineering
+        Major("AERO", "Aerospace Engineering", College.ENGINEERING),
+        Major("BIOM", "Biomedical Engineering", College.ENGINEERING),
+        Major("BSE", "Biological Systems Engineering", College.ENGINEERING),
+        Major("BC", "Building Construction", College.ENGINEERING),
+        Major("CHE", "Chemical Engineering", College.ENGINEERING),
+        Major("CSI", "Chip-Scale Integration", College.ENGINEERING),
+        Major("CE", "Civil Engineering", College.ENGINEERING),
+        Major("CPE", "Computer Engineering", College.ENGINEERING),
+        Major("CS", "Computer Science", College.ENGINEERING),
+        Major("CEM", "Construction Engineering and Management", College.ENGINEERING),
+        Major("CSL", "Construction Safety Leadership", College.ENGINEERING),
+        Major("CRA", "Controls, Robotics & Autonomy", College.ENGINEERING),
+        Major("DCC", "Data-Centric Computing", College.ENGINEERING),
+        Major("EE", "Electrical Engineering", College.ENGINEERING),
+        Major("EPPS", "Energy & Power Electronic Systems", College.ENGINEERING),
+        Major("ENVE", "Environmental Engineering", College.ENGINEERING),
+        Major("ISE", "Industrial and Systems Engineering", College.ENGINEERING),
+        Major("ML", "Machine Learning", College.ENGINEERING),
+        Major("MSE", "Materials Science and Engineering", College.ENGINEERING),
+        Major("ME", "Mechanical Engineering", College.ENGINEERING),
+        Major("MNS", "Micro/Nanosystems", College.ENGINEERING),
+        Major("MINE", "Mining Engineering", College.ENGINEERING),
+        Major("NC", "Networking & Cybersecurity", College.ENGINEERING),
+        Major("OE", "Ocean Engineering", College.ENGINEERING),
+        Major("SAS", "Smart and Autonomous Systems", College.ENGINEERING),
+
+        # College of Science
+        Major("BIOC", "Biochemistry", College.SCIENCE),
+        Major("BIOL", "Biological Sciences", College.SCIENCE),
+        Major("CHEMBA", "Chemistry (B.A.)", College.SCIENCE),
+        Major("CHEMBS", "Chemistry (B.S.)", College.SCIENCE),
+        Major("CLNS", "Clinical Neuroscience", College.SCIENCE),
+        Major("CBNS", "Cognitive and Behavioral Neuroscience", College.SCIENCE),
+        Major("CSNS", "Computational and Systems Neuroscience", College.SCIENCE),
+        Major("CMDA", "Computational Modeling and Data Analytics", College.SCIENCE),
+        Major("ECON", "Economics", College.SCIENCE),
+        Major("GEOS", "Geosciences", College.SCIENCE),
+        Major("MATH", "Mathematics", College.SCIENCE),
+        Major("MEDC", "Medicinal Chemistry", College.SCIENCE),
+        Major("METR", "Meteorology", College.SCIENCE),
+        Major("MICR", "Microbiology", College.SCIENCE),
+        Major("NANM", "Nanomedicine", College.SCIENCE),
+        Major("NANS", "Nanoscience", College.SCIENCE),
+        Major("NEUR", "Neuroscience", College.SCIENCE),
+        Major("PHYS", "Physics", College.SCIENCE),
+        Major("POLC", "Polymer Chemistry", College.SCIENCE),
+        Major("PSYC", "Psychology", College.SCIENCE),
+        Major("STAT", "Statistics", College.SCIENCE),
+
+        # College of Liberal Arts and Human Sciences
+        Major("ADV", "Advertising", College.LIBERAL_ARTS),
+        Major("ARAB", "Arabic", College.LIBERAL_ARTS),
+        Major("CINE", "Cinema", College.LIBERAL_ARTS),
+        Major("CLAS", "Classical Studies", College.LIBERAL_ARTS),
+        Major("COMM", "Communication", College.LIBERAL_ARTS),
+        Major("CRTC", "Creative Technologies", College.LIBERAL_ARTS),
+        Major("CW", "Creative Writing", College.LIBERAL_ARTS),
+        Major("CRIM", "Criminology", College.LIBERAL_ARTS),
+        Major("ENGL", "English", College.LIBERAL_ARTS),
+        Major("ELAE", "English Language Arts Education", College.LIBERAL_ARTS),
+        Major("FR", "French", College.LIBERAL_ARTS),
+        Major("GEOG", "Geography", College.LIBERAL_ARTS),
+        Major("GER", "German", College.LIBERAL_ARTS),
+        Major("HIST", "History", College.LIBERAL_ARTS),
+        Major("HSSE", "History and Social Sciences Education", College.LIBERAL_ARTS),
+        Major("HD", "Human Development", College.LIBERAL_ARTS),
+        Major("HPS", "Humanities for Public Service", College.LIBERAL_ARTS),
+        Major("IS", "International Studies", College.LIBERAL_ARTS),
+        Major("MJ", "Multimedia Journalism", College.LIBERAL_ARTS),
+        Major("MUS", "Music", College.LIBERAL_ARTS),
+        Major("NSFA", "National Security & Foreign Affairs", College.LIBERAL_ARTS),
+        Major("PHIL", "Philosophy", College.LIBERAL_ARTS),
+        Major("PPE", "Philosophy, Politics, and Economics", College.LIBERAL_ARTS),
+        Major("PSCI", "Political Science", College.LIBERAL_ARTS),
+        Major("PR", "Public Relations", College.LIBERAL_ARTS),
+        Major("RC", "Religion and Culture", College.LIBERAL_ARTS),
+        Major("RUS", "Russian", College.LIBERAL_ARTS),
+        Major("SOC", "Sociology", College.LIBERAL_ARTS),
+        Major("SPAN", "Spanish", College.LIBERAL_ARTS),
+        Major("TA", "Theatre Arts", College.LIBERAL_ARTS),
+        Major("SW", "Social Work", College.LIBERAL_ARTS),
+
+        # College of Agriculture and Life Sciences
+        Major("AGRI", "Agribusiness", College.AGRICULTURE),
+        Major("AGEE", "Agricultural and Extension Education", College.AGRICULTURE),
+        Major("APSC", "Animal and Poultry Sciences", College.AGRICULTURE),
+        Major("CROP", "Crop and Soil Sciences", College.AGRICULTURE),
+        Major("DAIR", "Dairy Science", College.AGRICULTURE),
+        Major("ECS", "Environmental Conservation & Society", College.AGRICULTURE),
+        Major("EDS", "Environmental Data Science", College.AGRICULTURE),
+        Major("EEMP", "Environmental Economics, Management, and Policy", College.AGRICULTURE),
+        Major("EHRT", "Environmental Horticulture", College.AGRICULTURE),
+        Major("ESCI", "Environmental Science", College.AGRICULTURE),
+        Major("FCON", "Fish Conservation", College.AGRICULTURE),
+        Major("FHSE", "Food and Health Systems Economics", College.AGRICULTURE),
+        Major("FST", "Food Science and Technology", College.AGRICULTURE),
+        Major("FOR", "Forestry", College.AGRICULTURE),
+        Major("IAT", "Integrated Agriculture Technologies", College.AGRICULTURE),
+        Major("LDTS", "Landscape Design and Turfgrass Science", College.AGRICULTURE),
+        Major("PLSC", "Plant Science", College.AGRICULTURE),
+        Major("SBM", "Sustainable Biomaterials", College.AGRICULTURE),
+        Major("WLDC", "Wildlife Conservation", College.AGRICULTURE),
+
+        # College of Architecture, Arts, and Design
+        Major("ARCH", "Architecture", College.ARCHITECTURE),
+        Major("ART", "Art", College.ARCHITECTURE),
+        Major("GRDS", "Graphic Design", College.ARCHITECTURE),
+        Major("IND", "Industrial Design", College.ARCHITECTURE),
+        Major("INTD", "Interior Design", College.ARCHITECTURE),
+        Major("LAR", "Landscape Architecture", College.ARCHITECTURE),
+        Major("SART", "Studio Art", College.ARCHITECTURE),
+
+        # College of Natural Resources and Environment
+        Major("EENG", "Ecological Engineering", College.NATURAL_RESOURCES),
+        Major("ERST", "Ecological Restoration", College.NATURAL_RESOURCES),
+        Major("EPP", "Environmental Policy and Planning", College.NATURAL_RESOURCES),
+        Major("ERM", "Environmental Resources Management", College.NATURAL_RESOURCES),
+        Major("PSD", "Packaging Systems and Design", College.NATURAL_RESOURCES),
+        Major("UAP", "Urban Affairs and Planning", College.NATURAL_RESOURCES),
+
+        # Virginia Tech Carilion School of Medicine and related
+        Major("NUDI", "Nutrition and Dietetics", College.HEALTH_SCIENCES),
+        Major("PH", "Public Health", College.HEALTH_SCIENCES),
+        Major("EHS", "Exercise and Health Sciences", College.HEALTH_SCIENCES),
+
+        # School of Education
+        Major("CTEA", "Career and Technical Education - Agricultural Education", College.EDUCATION),
+        Major("CTE", "Career and Technical Education", College.EDUCATION),
+        Major("ECDE", "Early Childhood Development and Education", College.EDUCATION),
+        Major("ELEM", "Elementary Education (PK-6)", College.EDUCATION),
+        Major("MAED", "Mathematics Education", College.EDUCATION),
+        Major("SCED", "Science Education", College.EDUCATION),
+
+        # Other Programs
+        Major("AEM", "Applied Electromagnetics", College.OTHER),
+        Major("APPS", "Applied Public Policy Studies", College.OTHER),
+        Major("CED", "Community Economic Development", College.OTHER),
+        Major("CLD", "Community Leadership and Development", College.OTHER),
+        Major("CONS", "Consumer Studies", College.OTHER),
+        Major("EDGE", "Environment, Development, and Global Economy", College.OTHER),
+        Major("EEM", "Event & Experience Management", College.OTHER),
+        Major("FMD", "Fashion Merchandising and Design", College.OTHER),
+        Major("IR", "International Relations", College.OTHER),
+        Major("ITD", "International Trade and Development", College.OTHER),
+        Major("SM", "Sport Management", College.OTHER),
+
+        # Catch-all for undeclared
+        Major("OTHER", "Other / Undeclared", College.GENERAL),
+    )
+
+
+def _load_supported_minors() -> Tuple[Minor, ...]:
+    """All supported minors for the signup form (sourced from VT catalog)"""
+    return (
+        Minor("ACSC", "Actuarial Science"),
+        Minor("ABB", "Adaptive Brain and Behavior"),
+        Minor("ADV", "Advertising"),
+        Minor("AFST", "Africana Studies"),
+        Minor("ABAE", "Agribusiness and Entrepreneurship"),
+        Minor("AEMN", "Agricultural and Applied Economics"),
+        Minor("APSC", "Animal and Poultry Sciences"),
+        Minor("APEQ", "Animal and Poultry Sciences Equine"),
+        Minor("APCE", "Appalachian Cultures and Environments"),
+        Minor("AMUS", "Applied Music"),
+        Minor("ARBC", "Arabic"),
+        Minor("AHST", "Art History"),
+        Minor("ASIA", "Asian Studies"),
+        Minor("ASTR", "Astronomy"),
+        Minor("BDS", "Behavioral Decision Science"),
+        Minor("BIOD", "Biodiversity Conservation"),
+        Minor("BIPH", "Biological Physics"),
+        Minor("BIOL", "Biological Sciences"),
+        Minor("BME", "Biomedical Engineering"),
+        Minor("BLPL", "Blue Planet"),
+        Minor("BUSR", "Business"),
+        Minor("BSUS", "Business Sustainability"),
+        Minor("CHEM", "Chemistry"),
+        Minor("CHNS", "Chinese Studies"),
+        Minor("CINE", "Cinema"),
+        Minor("CAFS", "Civic Agriculture and Food Systems"),
+        Minor("CLA", "Classical Studies"),
+        Minor("CLSO", "Climate and Society"),
+        Minor("CMAM", "Commodity Market Analytics"),
+        Minor("CEWS", "Communicating and Engaging with Science"),
+        Minor("CSE", "Community Systems and Engagement"),
+        Minor("CS", "Computer Science"),
+        Minor("CONS", "Consumer Studies"),
+        Minor("CSES", "Crop & Soil Environmental Sciences"),
+        Minor("CYBR", "Cybersecurity"),
+        Minor("DASC", "Dairy Science"),
+        Minor("DTDC", "Data and Decisions"),
+        Minor("DTCE", "Design + Technology + Creative Expression"),
+        Minor("DAIT", "Development and International Trade"),
+        Minor("DMS", "Digital Marketing Strategy"),
+        Minor("DST", "Disability Studies"),
+        Minor("DSPS", "Displacement Studies"),
+        Minor("DCE", "Diversity and Community Engagement"),
+        Minor("ECDE", "Early Childhood Development and Education"),
+        Minor("ECOC", "Ecological Cities"),
+        Minor("ECAS", "Economics"),
+        Minor("EDEI", "Economics of Diversity, Equity, and Inclusion"),
+        Minor("EHWB", "Ecosystem for Human Well-Being"),
+        Minor("ESM", "Engineering Science & Mechanics"),
+        Minor("CENG", "English - Creative Writing"),
+        Minor("ENT", "Entomology"),
+        Minor("ENVG", "Entrepreneurship - New Venture Growth"),
+        Minor("EECO", "Environmental Economics"),
+        Minor("EPP", "Environmental Policy and Planning"),
+        Minor("ENSC", "Environmental Science"),
+        Minor("ESGA", "Environmental, Social and Governance Analytics"),
+        Minor("EEMG", "Event & Experience Management"),
+        Minor("FRMT", "Fermentation"),
+        Minor("FIN", "Finance"),
+        Minor("FST", "Food Science and Technology"),
+        Minor("FAS", "Food, Agriculture, and Society"),
+        Minor("FORS", "Forestry"),
+        Minor("FR", "French"),
+        Minor("FRBS", "French for Business"),
+        Minor("GST", "Gender, Science and Technology"),
+        Minor("GIS", "Geographic Information Science"),
+        Minor("GISG", "Geographic Information Science (GIS-G) Meteorology/Geography Majors"),
+        Minor("GEOG", "Geography"),
+        Minor("GEOS", "Geosciences"),
+        Minor("GER", "German"),
+        Minor("GDPE", "Global Development and Political Economy"),
+        Minor("GLBE", "Global Engagement"),
+        Minor("GFSH", "Global Food Security and Health"),
+        Minor("GREN", "Green Engineering"),
+        Minor("HCOM", "Health Communication"),
+        Minor("HIST", "History"),
+        Minor("HONO", "Honors Collaborative Discovery"),
+        Minor("HORT", "Horticulture"),
+        Minor("HOSO", "Housing and Society"),
+        Minor("HCI", "Human-Computer Interaction"),
+        Minor("HSE", "Humanities, Science and Environment"),
+        Minor("NDIG", "Indigenous Studies"),
+        Minor("IDS", "Industrial Design"),
+        Minor("ISDA", "Integrated Security"),
+        Minor("IHW", "Integrative Health and Wellness"),
+        Minor("IB", "International Business"),
+        Minor("IREL", "International Relations"),
+        Minor("IS", "International Studies"),
+        Minor("ITAL", "Italian"),
+        Minor("JPNS", "Japanese Studies"),
+        Minor("JUD", "Judaic Studies"),
+        Minor("LAR", "Landscape Architecture"),
+        Minor("LCPS", "Language and Culture for the Practice of Science"),
+        Minor("LNGS", "Language Sciences"),
+        Minor("LAS", "Leadership and Service"),
+        Minor("ILRM", "Leadership and Social Change"),
+        Minor("LMCC", "Leadership, Corps of Cadets"),
+        Minor("LIT", "Literature"),
+        Minor("MTSC", "Materials in Society"),
+        Minor("MATH", "Mathematics"),
+        Minor("MSOC", "Medicine and Society"),
+        Minor("MTRG", "Meteorology"),
+        Minor("MEST", "Middle East Studies"),
+        Minor("MMJS", "Music (Jazz Studies)"),
+        Minor("MUSC", "Music"),
+        Minor("MMTX", "Music (Technology Emphasis)"),
+        Minor("MPTC", "Music Production, Technology, and Composition"),
+        Minor("NANO", "Nanoscience"),
+        Minor("NSFA", "National Security and Foreign Affairs"),
+        Minor("NRR", "Natural Resources Recreation"),
+        Minor("NAVE", "Naval Engineering"),
+        Minor("MN", "Naval Leadership"),
+        Minor("NE", "Nuclear Engineering"),
+        Minor("BOLD", "Organizational Leadership"),
+        Minor("PSD", "Packaging Systems & Design"),
+        Minor("PSUS", "Pathways to Sustainability"),
+        Minor("PSSJ", "Peace Studies and Social Justice"),
+        Minor("PHIL", "Philosophy"),
+        Minor("PPEM", "Philosophy, Politics, and Economics"),
+        Minor("PHYS", "Physics"),
+        Minor("PHS", "Plant Health Sciences"),
+        Minor("PSCI", "Political Science"),
+        Minor("POPC", "Popular Culture"),
+        Minor("PRFS", "Professional Sales"),
+        Minor("PM", "Property Management"),
+        Minor("PSYC", "Psychology"),
+        Minor("PH", "Public Health"),
+        Minor("QUAN", "Quantum Information Science and Engineering"),
+        Minor("REAL", "Real Estate"),
+        Minor("REL", "Religion"),
+        Minor("MRJ", "Religion and Journalism"),
+        Minor("RUS", "Russian"),
+        Minor("SCED", "Science Education"),
+        Minor("STL", "Science, Technology, and Law"),
+        Minor("SOC", "Sociology"),
+        Minor("SPAN", "Spanish"),
+        Minor("STAT", "Statistics"),
+        Minor("SCM", "Supply Chain Management"),
+        Minor("SUST", "Sustainability"),
+        Minor("SYSB", "Systems Biology"),
+        Minor("CYSE", "Technology, Cybersecurity, and Policy"),
+        Minor("TA", "Theatre Arts"),
+        Minor("TBMH", "Translational Biology, Medicine, & Health"),
+        Minor("WATR", "Water: Resources, Policy, and Management"),
+        Minor("WGS", "Women's and Gender Studies"),
+        Minor("NONE", "No Minor"),
+    )
+
+
+def _load_major_concentrations() -> Dict[str, Tuple[Concentration, ...]]:
+    """Concentrations/options by major code; only majors that have them are listed"""
+    return {
+        # Computer Science & Related
+        "CS": (
+            Concentration("CS-GEN", "General Computer Science"),
+            Concentration("CS-SYS", "Systems"),
+            Concentration("CS-SEC", "Security"),
+            Concentration("CS-AI", "Artificial Intelligence & Machine Learning"),
+            Concentration("CS-HCI", "Human-Computer Interaction"),
+            Concentration("CS-DATA", "Data & Analytics"),
+            Concentration("CS-TIC", "Theory & Algorithms"),
+        ),
+        "CPE": (
+            Concentration("CPE-GEN", "General Computer Engineering"),
+            Concentration("CPE-EMB", "Embedded Systems"),
+            Concentration("CPE-NET", "Networks & Security"),
+        ),
+        "EE": (
+            Concentration("EE-GEN", "General Electrical Engineering"),
+            Concentration("EE-POW", "Power & Energy Systems"),
+            Concentration("EE-COMM", "Communications & Signal Processing"),
+            Concentration("EE-CTRL", "Controls & Robotics"),
+            Concentration("EE-MICRO", "Microelectronics"),
+        ),
+
+        # Business - Pamplin
+        "MKTG": (
+            Concentration("MKTG-GEN", "General Marketing"),
+            Concentration("MKTG-DIG", "Digital Marketing Strategy"),
+            Concentration("MKTG-SAL", "Professional Sales"),
+        ),
+        "FIN": (
+            Concentration("FIN-GEN", "General Finance"),
+            Concentration("FIN-CFA", "Investment Management & CFA"),
+            Concentration("FIN-CORP", "Corporate Finance"),
+            Concentration("FIN-BANK", "Banking"),
+        ),
+        "MGT": (
+            Concentration("MGT-GEN", "General Management"),
+            Concentration("MGT-ENT", "Entrepreneurship"),
+            Concentration("MGT-OP", "Operations Management"),
+            Concentration("MGT-SCM", "Supply Chain Management"),
+        ),
+        "ACIS": (
+            Concentration("ACIS-ACC", "Accounting"),
+            Concentration("ACIS-IS", "Information Systems"),
+            Concentration("ACIS-CPA", "CPA Track"),
+        ),
+        "BIT": (
+            Concentration("BIT-GEN", "General Business IT"),
+            Concentration("BIT-DSS", "Decision Support Systems"),
+            Concentration("BIT-OM", "Operations Management"),
+        ),
+        "HTM": (
+            Concentration("HTM-GEN", "General Hospitality & Tourism"),
+            Concentration("HTM-EVT", "Event Management"),
+            Concentration("HTM-RES", "Restaurant Management"),
+            Concentration("HTM-HOTEL", "Hotel Management"),
+        ),
+
+        # Engineering
+        "ME": (
+            Concentration("ME-GEN", "General Mechanical Engineering"),
+            Concentration("ME-AUTO", "Automotive"),
+            Concentration("ME-AERO", "Aerospace Applications"),
+            Concentration("ME-THERM", "Thermal & Fluid Systems"),
+            Concentration("ME-MFG", "Manufacturing"),
+            Concentration("ME-BIO", "Biomechanics"),
+        ),
+        "CE": (
+            Concentration("CE-GEN", "General Civil Engineering"),
+            Concentration("CE-STR", "Structural Engineering"),
+            Concentration("CE-TRAN", "Transportation"),
+            Concentration("CE-GEO", "Geotechnical"),
+            Concentration("CE-WR", "Water Resources"),
+        ),
+        "CHE": (
+            Concentration("CHE-GEN", "General Chemical Engineering"),
+            Concentration("CHE-BIO", "Biochemical"),
+            Concentration("CHE-ENV", "Environmental"),
+            Concentration("CHE-MAT", "Materials"),
+        ),
+        "AERO": (
+            Concentration("AERO-GEN", "General Aerospace Engineering"),
+            Concentration("AERO-PROP", "Propulsion"),
+            Concentration("AERO-STRUCT", "Structures"),
+            Concentration("AERO-DYN", "Aerodynamics"),
+        ),
+        "ISE": (
+            Concentration("ISE-GEN", "General Industrial & Systems"),
+            Concentration("ISE-OR", "Operations Research"),
+            Concentration("ISE-HF", "Human Factors"),
+            Concentration("ISE-MFG", "Manufacturing Systems"),
+        ),
+        "BSE": (
+            Concentration("BSE-GEN", "General Biological Systems"),
+            Concentration("BSE-BIO", "Bioprocess Engineering"),
+            Concentration("BSE-ENV", "Environmental Engineering"),
+            Concentration("BSE-FOOD", "Food & Bioprocess"),
+        ),
+        "BIOM": (
+            Concentration("BIOM-GEN", "General Biomedical Engineering"),
+            Concentration("BIOM-BM", "Biomechanics"),
+            Concentration("BIOM-BI", "Bioinstrumentation"),
+            Concentration("BIOM-TISS", "Tissue Engineering"),
+        ),
+
+        # Science
+        "BIOL": (
+            Concentration("BIOL-GEN", "General Biology"),
+            Concentration("BIOL-CELL", "Cell & Molecular Biology"),
+            Concentration("BIOL-ECO", "Ecology & Conservation"),
+            Concentration("BIOL-MED", "Pre-Medical"),
+            Concentration("BIOL-MICR", "Microbiology"),
+        ),
+        "CHEMBS": (
+            Concentration("CHEM-GEN", "General Chemistry"),
+            Concentration("CHEM-BIO", "Biochemistry"),
+            Concentration("CHEM-MAT", "Materials Chemistry"),
+            Concentration("CHEM-ENV", "Environmental Chemistry"),
+        ),
+        "PSYC": (
+            Concentration("PSYC-GEN", "General Psychology"),
+            Concentration("PSYC-CLIN", "Clinical Psychology"),
+            Concentration("PSYC-COG", "Cognitive Psychology"),
+            Concentration("PSYC-DEV", "Developmental Psychology"),
+            Concentration("PSYC-SOC", "Social Psychology"),
+            Concentration("PSYC-IO", "Industrial-Organizational"),
+        ),
+        "ECON": (
+            Concentration("ECON-GEN", "General Economics"),
+            Concentration("ECON-FIN", "Financial Economics"),
+            Concentration("ECON-INT", "International Economics"),
+            Concentration("ECON-POL", "Policy Analysis"),
+        ),
+        "MATH": (
+            Concentration("MATH-GEN", "General Mathematics"),
+            Concentration("MATH-APP", "Applied Mathematics"),
+            Concentration("MATH-STAT", "Statistics"),
+            Concentration("MATH-ACT", "Actuarial Science"),
+            Concentration("MATH-COMP", "Computational"),
+        ),
+        "STAT": (
+            Concentration("STAT-GEN", "General Statistics"),
+            Concentration("STAT-BIO", "Biostatistics"),
+            Concentration("STAT-DATA", "Data Science"),
+        ),
+        "CMDA": (
+            Concentration("CMDA-GEN", "General CMDA"),
+            Concentration("CMDA-DS", "Data Science"),
+            Concentration("CMDA-OR", "Operations Research"),
+            Concentration("CMDA-BIO", "Computational Biology"),
+        ),
+        "PHYS": (
+            Concentration("PHYS-GEN", "General Physics"),
+            Concentration("PHYS-ASTRO", "Astrophysics"),
+            Concentration("PHYS-BIO", "Biophysics"),
+            Concentration("PHYS-COMP", "Computational Physics"),
+        ),
+
+        # Liberal Arts
+        "COMM": (
+            Concentration("COMM-GEN", "General Communication"),
+            Concentration("COMM-PR", "Public Relations"),
+            Concentration("COMM-ADV", "Advertising"),
+            Concentration("COMM-JOUR", "Journalism"),
+        ),
+        "ENGL": (
+            Concentration("ENGL-GEN", "General English"),
+            Concentration("ENGL-CW", "Creative Writing"),
+            Concentration("ENGL-LIT", "Literature"),
+            Concentration("ENGL-RHT", "Rhetoric & Writing"),
+        ),
+        "PSCI": (
+            Concentration("PSCI-GEN", "General Political Science"),
+            Concentration("PSCI-LAW", "Pre-Law"),
+            Concentration("PSCI-IR", "International Relations"),
+            Concentration("PSCI-POL", "American Politics"),
+        ),
+        "SOC": (
+            Concentration("SOC-GEN", "General Sociology"),
+            Concentration("SOC-CRIM", "Criminology"),
+            Concentration("SOC-FAM", "Family & Community"),
+        ),
+        "HIST": (
+            Concentration("HIST-GEN", "General History"),
+            Concentration("HIST-US", "American History"),
+            Concentration("HIST-EUR", "European History"),
+            Concentration("HIST-GLOB", "Global History"),
+        ),
+
+        # Architecture & Design
+        "ARCH": (
+            Concentration("ARCH-GEN", "General Architecture"),
+            Concentration("ARCH-URB", "Urban Design"),
+            Concentration("ARCH-SUST", "Sustainable Design"),
+        ),
+        "IND": (
+            Concentration("IND-GEN", "General Industrial Design"),
+            Concentration("IND-PROD", "Product Design"),
+            Concentration("IND-UX", "User Experience"),
+        ),
+        "INTD": (
+            Concentration("INTD-GEN", "General Interior Design"),
+            Concentration("INTD-COM", "Commercial Design"),
+            Concentration("INTD-RES", "Residential Design"),
+        ),
+
+        # Agriculture & Life Sciences
+        "APSC": (
+            Concentration("APSC-GEN", "General Animal Science"),
+            Concentration("APSC-PREVET", "Pre-Veterinary"),
+            Concentration("APSC-PROD", "Animal Production"),
+            Concentration("APSC-EQ", "Equine Science"),
+        ),
+        "FST": (
+            Concentration("FST-GEN", "General Food Science"),
+            Concentration("FST-SAFE", "Food Safety"),
+            Concentration("FST-PROC", "Food Processing"),
+        ),
+
+        # Health Sciences
+        "NUDI": (
+            Concentration("NUDI-GEN", "General Nutrition"),
+            Concentration("NUDI-DIET", "Dietetics"),
+            Concentration("NUDI-SPORT", "Sports Nutrition"),
+        ),
+        "PH": (
+            Concentration("PH-GEN", "General Public Health"),
+            Concentration("PH-EPI", "Epidemiology"),
+            Concentration("PH-HP", "Health Promotion"),
+        ),
+    }
+
+
+
+def _index_by_code(table: str) -> Dict[str, Union[Major, Minor]]:
+    """Code -> row index over a catalog table (the table keeps display order)"""
+    return {m.code: m for m in _lazy_table(table)}
+
+
+def _index_concentrations_by_code() -> Dict[str, Concentration]:
+    """Concentration code -> row across every major"""
+    return {
+        c.code: c
+        for concentrations in _lazy_table("MAJOR_CONCENTRATIONS").values()
+        for c in concentrations
+    }
+
+
+def _index_concentration_pairs() -> Dict[Tuple[str, str], str]:
+    """(major code, concentration code) -> concentration name"""
+    return {
+        (major, c.code): c.name
+        for major, concentrations in _lazy_table("MAJOR_CONCENTRATIONS").items()
+        for c in concentrations
+    }
+
+
+def _index_concentration_codes() -> Dict[str, FrozenSet[str]]:
+    """Major code -> the concentration codes it offers"""
+    return {
+        major: frozenset(c.code for c in concentrations)
+        for major, concentrations in _lazy_table("MAJOR_CONCENTRATIONS").items()
+    }
+
+
+def _index_majors_by_concentration_name() -> Dict[str, Tuple[str, ...]]:
+    """Concentration name -> codes of the majors offering it, in catalog order"""
+    index: Dict[str, List[str]] = {}
+    for major, concentrations in _lazy_table("MAJOR_CONCENTRATIONS").items():
+        for c in concentrations:
+            index.setdefault(c.name, []).append(major)
+    return {name: tuple(majors) for name, majors in index.items()}
+
+
+def _group_majors_by_college() -> Dict[College, Tuple[Major, ...]]:
+    """Group SUPPORTED_MAJORS by college, keeping list order within each"""
+    groups: Dict[College, List[Major]] = {}
+    for major in _lazy_table("SUPPORTED_MAJORS"):
+        groups.setdefault(major.college, []).append(major)
+    return {college: tuple(majors) for college, majors in groups.items()}
+
+
+_LAZY_TABLES = {
+    "SUPPORTED_MAJORS": _load_supported_majors,
+    "SUPPORTED_MINORS": _load_supported_minors,
+    "MAJOR_CONCENTRATIONS": _load_major_concentrations,
+    "SUPPORTED_MAJORS_BY_CODE": lambda: _index_by_code("SUPPORTED_MAJORS"),
+    "SUPPORTED_MINORS_BY_CODE": lambda: _index_by_code("SUPPORTED_MINORS"),
+    "MAJOR_CONCENTRATIONS_BY_CODE": _index_concentrations_by_code,
+    "CONCENTRATION_LOOKUP": _index_concentration_pairs,
+    "CONCENTRATIONS_BY_MAJOR_CODES": _index_concentration_codes,
+    "VALID_MAJOR_CODES": lambda: frozenset(_lazy_table("SUPPORTED_MAJORS_BY_CODE")),
+    "VALID_MINOR_CODES": lambda: frozenset(_lazy_table("SUPPORTED_MINORS_BY_CODE")),
+    "VALID_CONCENTRATION_CODES": lambda: frozenset(_lazy_table("MAJOR_CONCENTRATIONS_BY_CODE")),
+    "MAJORS_BY_CONCENTRATION_NAME": _index_majors_by_concentration_name,
+    "MAJORS_BY_COLLEGE": _group_majors_by_college,
+}
+
+
+def _lazy_table(name: str):
+    """Build a catalog table on first use and keep it as a module global"""
+    value = globals().get(name)
+    if value is None:
+        value = globals()[name] = _LAZY_TABLES[name]()
+    return value
+
+
+def __getattr__(name: str):
+    """Resolve the catalog tables on first access"""
+    if name in _LAZY_TABLES:
+        return _lazy_table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_concentrations(major_code: str) -> Tuple[Concentration, ...]:
+    """Get available concentrations for a major"""
+    return _lazy_table("MAJOR_CONCENTRATIONS").get(major_code.upper(), ())
+
+
+def is_valid_concentration(major_code: str, concentration_code: str) -> bool:
+    """Check whether a concentration is offered by a major"""
+    codes = _lazy_table("CONCENTRATIONS_BY_MAJOR_CODES").get(major_code.upper())
+    return codes is not None and concentration_code.upper() in codes
+
+
+def get_majors_offering(concentration_name: str) -> List[str]:
+    """Get codes of majors that offer a concentration (e.g. "Data Science")"""
+    return list(_lazy_table("MAJORS_BY_CONCENTRATION_NAME").get(concentration_name, ()))
+
+
+def get_majors_in_college(college: str) -> Tuple[Major, ...]:
+    """Get supported majors offered by a college (e.g. "Engineering")"""
+    return _lazy_table("MAJORS_BY_COLLEGE").get(college, ())
+
+
+def get_minor_name(minor_code: str) -> Optional[str]:
+    """Get a minor's display name by exact code, or None if it isn't listed"""
+    minor = _lazy_table("SUPPORTED_MINORS_BY_CODE").get(minor_code)
+    return minor.name if minor is not None else None
+
+
+def get_major_info(major_code: str) -> Optional[Major]:
+    """Get basic info about a major"""
+    return _lazy_table("SUPPORTED_MAJORS_BY_CODE").get(major_code.upper())
@@ -5,11 +5,44 @@ Comprehensive parser for Virginia Tech DARS audit reports.
 Extracts completed courses, in-progress courses, requirements, and student info.
 """
 
+import hashlib
 import re
+import sys
+from operator import attrgetter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
 
+SEMESTER_NAMES = {"FA": "Fall", "SP": "Spring", "SU": "Summer", "WI": "Winter"}
+
+# Display names for term codes seen so far ("24FA" -> "Fall 2024")
+_TERM_NAMES: Dict[str, str] = {}
+
+
+def _term_name(term: str) -> str:
+    """Display name for a term code, memoized since audits repeat few terms"""
+    name = _TERM_NAMES.get(term)
+    if name is None:
+        semester = term[2:]
+        name = f"{SEMESTER_NAMES.get(semester, semester)} 20{term[:2]}"
+        if len(_TERM_NAMES) < 1024:
+            _TERM_NAMES[term] = name
+    return name
+
+
+# Minor names recognized inside a noisy "... Minor" heading, in match order
+KNOWN_MINORS = ("Computer Science", "Mathematics", "Statistics")
+
+PATHWAYS_CONCEPTS = (
+    ("Pathways Concept 1", "Discourse"),
+    ("Pathways Concept 2", "Critical Thinking in the Humanities"),
+    ("Pathways Concept 3", "Reasoning in the Social Sciences"),
+    ("Pathways Concept 4", "Reasoning in the Natural Sciences"),
+    ("Pathways Concept 5", "Quantitative and Computational Thinking"),
+    ("Pathways Concept 6", "Critique and Practice in Design and the Arts"),
+    ("Pathways Concept 7", "Critical Analysis of Equity and Identity in the US"),
+)
+
 
 class GradeType(Enum):
     """Grade types in DARS"""
@@ -22,7 +55,19 @@ class GradeType(Enum):
     NO_GRADE = "no_grade"  # NS - no grade (internships)
 
 
-@dataclass
+# Non-letter grade codes and the grade type each maps to
+GRADE_TYPES = {
+    "IP": GradeType.IN_PROGRESS,
+    "W": GradeType.WITHDRAWN,
+    "TR": GradeType.TRANSFER,
+    "CB": GradeType.CREDIT_BY_EXAM,
+    "P": GradeType.PASS,
+    "S": GradeType.PASS,
+    "NS": GradeType.NO_GRADE,
+}
+
+
+@dataclass(slots=True)
 class Course:
     """Represents a course from DARS"""
     code: str                    # e.g., "CS 1114"
@@ -36,30 +81,19 @@ class Course:
     is_credit_by_exam: bool = False
 
     def __post_init__(self):
-        # Determine grade type
-        if self.grade == "IP":
-            self.grade_type = GradeType.IN_PROGRESS
-        elif self.grade == "W":
-            self.grade_type = GradeType.WITHDRAWN
-        elif self.grade == "TR":
-            self.grade_type = GradeType.TRANSFER
-        elif self.grade == "CB":
-            self.grade_type = GradeType.CREDIT_BY_EXAM
-            self.is_credit_by_exam = True
-        elif self.grade in ("P", "S"):
-            self.grade_type = GradeType.PASS
-        elif self.grade == "NS":
-            self.grade_type = GradeType.NO_GRADE
+        # Determine grade type (letter grades keep the default)
+        grade_type = GRADE_TYPES.get(self.grade)
+        if grade_type is not None:
+            self.grade_type = grade_type
+            if grade_type is GradeType.CREDIT_BY_EXAM:
+                self.is_credit_by_exam = True
 
         # Parse term name
         if self.term and len(self.term) >= 4:
-            year = "20" + self.term[:2]
-            semester = self.term[2:]
-            semester_map = {"FA": "Fall", "SP": "Spring", "SU": "Summer", "WI": "Winter"}
-            self.term_name = f"{semester_map.get(semester, semester)} {year}"
+            self.term_name = _term_name(self.term)
 
 
-@dataclass
+@dataclass(slots=True)
 class Requirement:
     """Represents an unfulfilled requirement"""
     name: str                    # e.g., "Language Study Requirement"
@@ -69,7 +103,7 @@ class Requirement:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DARSResult:
     """Complete parsed DARS result"""
     # Student Info
@@ -114,7 +148,7 @@ class DARSParser:
         r'(\d{2}[A-Z]{2})\s*'            # Term (e.g., 24FA) - optional space after
         r'([A-Z]{2,4})\s*(\d{4}[A-Z]?)\s+' # Course code split (e.g., ACIS 1504, CS 1114)
         r'(\d+\.?\d*)\s*'                # Credits (e.g., 3.0)
-        r'([A-Z][+-]?|IP|W|TR|CB|P|NS)\s+' # Grade
+        r'(IP|TR|CB|NS|[A-Z][+-]?)\s+'    # Grade - two-letter codes tried first
         r'(.+?)(?:\n|$)',                # Course name
         re.MULTILINE
     )
@@ -133,21 +167,69 @@ class DARSParser:
 
     GPA_PATTERN = re.compile(r'(\d+\.\d+)\s*GPA')
 
+    IN_PROGRESS_PATTERN = re.compile(
+        r'In-Progress Courses Have Been Used.*?(\d+\.?\d*)\s*HOURS ADDED(.*?)(?=\d+\)|AWARDED|$)',
+        re.DOTALL
+    )
+
+    # Header patterns
+    NAME_RE = re.compile(r'^([A-Za-z]+,\s*[A-Za-z\s]+?)(?:\n|BACHELOR)', re.MULTILINE)
+    DEGREE_RE = re.compile(r'BACHELOR OF SCIENCE IN ([A-Z\s&]+)')
+    MAJOR_RE = re.compile(r'MAJOR\s*[-–]\s*([A-Z\s&]+?)(?:\n|Prepared)')
+    PROGRAM_RE = re.compile(r'Program\s*Code\s*([A-Z]+)')
+    CATALOG_RE = re.compile(r'Catalog Year\s*(Fall|Spring|Summer)?\s*(\d{4})')
+    STUDENT_ID_RE = re.compile(r'Student ID\s*(\d+)')
+    GRAD_RE = re.compile(r'Graduation\s*Date\s*(\d{1,2}/\d{1,2}/\d{2,4})')
+    PREPARED_RE = re.compile(r'Prepared On\s*(\d{1,2}/\d{1,2}/\d{4}\s*\d{1,2}:\d{2}\s*[AP]M)')
+
+    # Credit summary and GPA patterns
+    VT_RE = re.compile(r'VT\s*:\s*(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)')
+    TRANSFER_RE = re.compile(r'TRANSFER:\s*(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)')
+    OVERALL_RE = re.compile(r'OVERALL\s*:\s*(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)')
+    TOTAL_NEEDS_RE = re.compile(r'NEEDS:\s*(\d+\.?\d*)\s*HOURS')
+    OVERALL_GPA_RE = re.compile(r'Overall GPA Must Be.*?AWARDED:\s*(\d+\.\d+)\s*GPA', re.DOTALL)
+    SUMMARY_GPA_RE = re.compile(r'OVERALL.*?(\d+\.\d+)\s*$', re.MULTILINE)
+    MAJOR_GPA_RE = re.compile(r'In-Major GPA.*?(\d+\.\d+)\s*GPA', re.DOTALL)
+
+    # Requirement, course list and minor patterns
+    NEEDS_SECTION_RE = re.compile(
+        r'(?:Complete|Required).*?NEEDS:\s*(\d+\.?\d*)\s*HOURS(?:\s*(\d+)\s*COURSES?)?\s*'
+        r'(?:SELECT FROM:\s*([^\n]+(?:\n[^\n]+)*))?',
+        re.MULTILINE
+    )
+    REQ_HEADER_RE = re.compile(r'([A-Z][A-Za-z\s\-&]+(?:Requirement|Courses?|Elective))')
+    COURSE_CODE_RE = re.compile(r'([A-Z]{2,4})\s*(\d{4}[A-Z]?)')
+    MINOR_RE = re.compile(r'([A-Z][A-Za-z\s]+?)\s+Minor\s*\n')
+
+    # Section headings located once per parse and shared by the section parsers
+    PATHWAYS_RE = re.compile('|'.join(re.escape(concept) for concept, _ in PATHWAYS_CONCEPTS))
+
+    SECTION_MARKERS = (
+        "Course History",
+        "In-Progress Courses Have Been Used",
+        "Language Study Requirement",
+        "Language Study",
+    )
+
     def __init__(self):
         self.result = DARSResult()
+        self._sections: Dict[str, int] = {}
+        self._reset_keys()
 
     def parse(self, text: str) -> DARSResult:
         """Parse DARS text and return structured result"""
         self.result = DARSResult()
+        self._reset_keys()
 
         # Clean text
         text = self._clean_text(text)
+        self._sections = {marker: text.find(marker) for marker in self.SECTION_MARKERS}
 
         # Parse sections
         self._parse_header(text)
         self._parse_credit_summary(text)
         self._parse_gpa(text)
-        self._parse_course_history(text)
+        self._parse_courses(text)
         self._parse_in_progress(text)
         self._parse_requirements(text)
         self._parse_pathways(text)
@@ -155,205 +237,183 @@ class DARSParser:
 
         return self.result
 
+    def _reset_keys(self):
+        """Reset the dedup keys kept alongside the result lists"""
+        self._completed_keys: Set[str] = set()
+        self._in_progress_keys: Set[str] = set()
+        self._withdrawn_keys: Set[Tuple[str, str]] = set()
+        self._requirement_names: Set[str] = set()
+
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        # Remove multiple spaces
-        text = re.sub(r' +', ' ', text)
+        # Remove multiple spaces (each pass halves the longest run)
+        while '  ' in text:
+            text = text.replace('  ', ' ')
         # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
         return text
 
     def _parse_header(self, text: str):
         """Parse header information"""
         # Student name - look for pattern like "Davuluri, Sai Chaitanya"
-        name_match = re.search(r'^([A-Za-z]+,\s*[A-Za-z\s]+?)(?:\n|BACHELOR)', text, re.MULTILINE)
+        name_match = self.NAME_RE.search(text)
         if name_match:
             self.result.student_name = name_match.group(1).strip()
 
         # Degree
-        degree_match = re.search(r'BACHELOR OF SCIENCE IN ([A-Z\s&]+)', text)
+        degree_match = self.DEGREE_RE.search(text)
         if degree_match:
             self.result.degree = f"BS in {degree_match.group(1).strip().title()}"
 
         # Major
-        major_match = re.search(r'MAJOR\s*[-–]\s*([A-Z\s&]+?)(?:\n|Prepared)', text)
+        major_match = self.MAJOR_RE.search(text)
         if major_match:
             self.result.major = major_match.group(1).strip().title()
 
         # Program Code
-        prog_match = re.search(r'Program\s*Code\s*([A-Z]+)', text)
+        prog_match = self.PROGRAM_RE.search(text)
         if prog_match:
             self.result.program_code = prog_match.group(1)
 
         # Catalog Year
-        catalog_match = re.search(r'Catalog Year\s*(Fall|Spring|Summer)?\s*(\d{4})', text)
+        catalog_match = self.CATALOG_RE.search(text)
         if catalog_match:
             semester = catalog_match.group(1) or ""
             year = catalog_match.group(2)
             self.result.catalog_year = f"{semester} {year}".strip()
 
         # Student ID
-        id_match = re.search(r'Student ID\s*(\d+)', text)
+        id_match = self.STUDENT_ID_RE.search(text)
         if id_match:
             self.result.student_id = id_match.group(1)
 
         # Graduation Date
-        grad_match = re.search(r'Graduation\s*Date\s*(\d{1,2}/\d{1,2}/\d{2,4})', text)
+        grad_match = self.GRAD_RE.search(text)
         if grad_match:
             self.result.graduation_date = grad_match.group(1)
 
         # Prepared Date
-        prep_match = re.search(r'Prepared On\s*(\d{1,2}/\d{1,2}/\d{4}\s*\d{1,2}:\d{2}\s*[AP]M)', text)
+        prep_match = self.PREPARED_RE.search(text)
         if prep_match:
             self.result.prepared_date = prep_match.group(1)
 
     def _parse_credit_summary(self, text: str):
         """Parse credit summary section"""
         # Look for the credit summary table
-        summary_match = re.search(
-            r'VT\s*:\s*(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)',
-            text
-        )
+        summary_match = self.VT_RE.search(text)
         if summary_match:
             self.result.vt_credits = float(summary_match.group(3))
 
-        transfer_match = re.search(
-            r'TRANSFER:\s*(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)',
-            text
-        )
+        transfer_match = self.TRANSFER_RE.search(text)
         if transfer_match:
             self.result.transfer_credits = float(transfer_match.group(3))
 
-        overall_match = re.search(
-            r'OVERALL\s*:\s*(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+\.?\d*)',
-            text
-        )
+        overall_match = self.OVERALL_RE.search(text)
         if overall_match:
             self.result.total_credits_earned = float(overall_match.group(3))
 
         # Total credits needed
-        needs_match = re.search(r'NEEDS:\s*(\d+\.?\d*)\s*HOURS', text)
+        needs_match = self.TOTAL_NEEDS_RE.search(text)
         if needs_match:
             self.result.total_credits_needed = float(needs_match.group(1))
 
     def _parse_gpa(self, text: str):
         """Parse GPA information"""
         # Overall GPA
-        overall_gpa_match = re.search(r'Overall GPA Must Be.*?AWARDED:\s*(\d+\.\d+)\s*GPA', text, re.DOTALL)
+        overall_gpa_match = self.OVERALL_GPA_RE.search(text)
         if overall_gpa_match:
             self.result.overall_gpa = float(overall_gpa_match.group(1))
         else:
             # Try from credit summary
-            gpa_match = re.search(r'OVERALL.*?(\d+\.\d+)\s*$', text, re.MULTILINE)
+            gpa_match = self.SUMMARY_GPA_RE.search(text)
             if gpa_match:
                 self.result.overall_gpa = float(gpa_match.group(1))
 
         # In-major GPA
-        major_gpa_match = re.search(r'In-Major GPA.*?(\d+\.\d+)\s*GPA', text, re.DOTALL)
+        major_gpa_match = self.MAJOR_GPA_RE.search(text)
         if major_gpa_match:
             self.result.in_major_gpa = float(major_gpa_match.group(1))
 
-    def _parse_course_history(self, text: str):
-        """Parse course history section"""
-        # Find Course History section
-        history_start = text.find("Course History")
-        if history_start == -1:
-            # Try parsing all courses from document
-            self._parse_all_courses(text)
-            return
+    def _parse_courses(self, text: str):
+        """Parse course rows from Course History, or the whole document without one.
 
-        history_text = text[history_start:]
+        Course History lists each attempt once. Without it, rows are taken
+        from the requirement blocks, which repeat courses, so they are
+        deduplicated and no-grade rows are skipped.
+        """
+        history_start = self._sections["Course History"]
+        in_history = history_start != -1
 
-        for match in self.COURSE_PATTERN.finditer(history_text):
-            term = match.group(1)
-            dept = match.group(2).strip()
-            num = match.group(3).strip()
-            code = f"{dept} {num}"
-            credits = float(match.group(4))
-            grade = match.group(5).strip()
-            name = match.group(6).strip()
+        for match in self.COURSE_PATTERN.finditer(text, max(history_start, 0)):
+            term, dept, num, credits, grade, name = match.groups()
+            # Audits repeat a few terms, grades and codes; share one copy of each
+            term = sys.intern(term)
+            grade = sys.intern(grade)
+            code = sys.intern(f"{dept} {num}")
+            name = name.strip()
 
             # Check for transfer info on next line
             transfer_from = ""
-            if "Northern Virginia" in name or "Transfer" in name:
+            if in_history and ("Northern Virginia" in name or "Transfer" in name):
                 transfer_from = "Northern Virginia CC"
 
             course = Course(
                 code=code,
-                name=name.split('\n')[0].strip(),  # Get just first line
-                credits=credits,
+                name=name,
+                credits=float(credits),
                 grade=grade,
                 term=term,
                 transfer_from=transfer_from
             )
 
             # Categorize course
-            if course.grade_type == GradeType.IN_PROGRESS:
-                self.result.in_progress_courses.append(course)
-            elif course.grade_type == GradeType.WITHDRAWN:
-                self.result.withdrawn_courses.append(course)
-            elif course.grade_type == GradeType.TRANSFER:
-                self.result.transfer_courses.append(course)
-                self.result.completed_courses.append(course)  # Also add to completed
-            else:
-                self.result.completed_courses.append(course)
-
-    def _parse_all_courses(self, text: str):
-        """Parse courses from entire document (fallback)"""
-        for match in self.COURSE_PATTERN.finditer(text):
-            term = match.group(1)
-            dept = match.group(2).strip()
-            num = match.group(3).strip()
-            code = f"{dept} {num}"
-            credits = float(match.group(4))
-            grade = match.group(5).strip()
-            name = match.group(6).strip()
-
-            course = Course(
-                code=code,
-                name=name.split('\n')[0].strip(),
-                credits=credits,
-                grade=grade,
-                term=term
-            )
-
-            # Categorize and avoid duplicates
-            if course.grade_type == GradeType.IN_PROGRESS:
-                if not any(c.code == course.code for c in self.result.in_progress_courses):
+            grade_type = course.grade_type
+            if grade_type == GradeType.IN_PROGRESS:
+                if in_history or code not in self._in_progress_keys:
+                    self._in_progress_keys.add(code)
                     self.result.in_progress_courses.append(course)
-            elif course.grade_type == GradeType.WITHDRAWN:
-                if not any(c.code == course.code and c.term == course.term for c in self.result.withdrawn_courses):
+            elif grade_type == GradeType.WITHDRAWN:
+                if in_history or (code, term) not in self._withdrawn_keys:
+                    self._withdrawn_keys.add((code, term))
                     self.result.withdrawn_courses.append(course)
-            elif course.grade_type != GradeType.NO_GRADE:
-                if not any(c.code == course.code for c in self.result.completed_courses):
-                    self.result.completed_courses.append(course)
+            elif in_history:
+                if grade_type == GradeType.TRANSFER:
+                    self.result.transfer_courses.append(course)  # Also add to completed
+                self._completed_keys.add(code)
+                self.result.completed_courses.append(course)
+            elif grade_type != GradeType.NO_GRADE and code not in self._completed_keys:
+                self._completed_keys.add(code)
+                self.result.completed_courses.append(course)
 
     def _parse_in_progress(self, text: str):
         """Parse in-progress courses specifically"""
         # Look for IP courses section
-        ip_match = re.search(r'In-Progress Courses Have Been Used.*?(\d+\.?\d*)\s*HOURS ADDED(.*?)(?=\d+\)|AWARDED|$)',
-                            text, re.DOTALL)
+        ip_start = self._sections["In-Progress Courses Have Been Used"]
+        if ip_start == -1:
+            return
+        ip_match = self.IN_PROGRESS_PATTERN.search(text, ip_start)
         if ip_match:
-            ip_text = ip_match.group(2)
-            for match in self.COURSE_PATTERN.finditer(ip_text):
-                term = match.group(1)
-                dept = match.group(2).strip()
-                num = match.group(3).strip()
-                code = f"{dept} {num}"
-                credits = float(match.group(4))
-                grade = match.group(5).strip()
-                name = match.group(6).strip()
-
-                if grade == "IP":
-                    course = Course(code=code, name=name, credits=credits, grade=grade, term=term)
-                    if not any(c.code == course.code for c in self.result.in_progress_courses):
-                        self.result.in_progress_courses.append(course)
+            # Scan the section in place rather than copying it out
+            for match in self.COURSE_PATTERN.finditer(text, ip_match.start(2), ip_match.end(2)):
+                term, dept, num, credits, grade, name = match.groups()
+                code = sys.intern(f"{dept} {num}")
+
+                if grade == "IP" and code not in self._in_progress_keys:
+                    course = Course(code=code, name=name.strip(), credits=float(credits),
+                                    grade=grade, term=sys.intern(term))
+                    self._in_progress_keys.add(code)
+                    self.result.in_progress_courses.append(course)
 
     def _parse_requirements(self, text: str):
         """Parse unfulfilled requirements (NEEDS sections)"""
         # Language requirement
-        if "Language Study Requirement" in text and "NEEDS:" in text[text.find("Language Study"):text.find("Language Study")+500]:
-            lang_section = text[text.find("Language Study Requirement"):text.find("Language Study Requirement")+500]
+        # NEEDS: is looked for after the first "Language Study" mention, which
+        # can precede the requirement heading; details come from the heading
+        lang_start = self._sections["Language Study Requirement"]
+        lang_mention = self._sections["Language Study"]
+        if lang_start != -1 and "NEEDS:" in text[lang_mention:lang_mention + 500]:
+            lang_section = text[lang_start:lang_start + 500]
             needs_match = self.NEEDS_PATTERN.search(lang_section)
             if needs_match:
                 req = Requirement(
@@ -364,14 +424,11 @@ class DARSParser:
                 select_match = self.SELECT_FROM_PATTERN.search(lang_section)
                 if select_match:
                     req.select_from = self._parse_course_list(select_match.group(1))
+                self._requirement_names.add(req.name)
                 self.result.unfulfilled_requirements.append(req)
 
         # Find all NEEDS sections
-        needs_sections = re.finditer(
-            r'(?:Complete|Required).*?NEEDS:\s*(\d+\.?\d*)\s*HOURS(?:\s*(\d+)\s*COURSES?)?\s*'
-            r'(?:SELECT FROM:\s*([^\n]+(?:\n[^\n]+)*))?',
-            text, re.MULTILINE
-        )
+        needs_sections = self.NEEDS_SECTION_RE.finditer(text)
 
         for match in needs_sections:
             # Try to get requirement name from context
@@ -379,7 +436,7 @@ class DARSParser:
             context = text[start:match.start()]
 
             # Find the requirement header
-            header_match = re.search(r'([A-Z][A-Za-z\s\-&]+(?:Requirement|Courses?|Elective))', context)
+            header_match = self.REQ_HEADER_RE.search(context)
             if header_match:
                 name = header_match.group(1).strip()
             else:
@@ -398,35 +455,36 @@ class DARSParser:
                 req.select_from = self._parse_course_list(match.group(3))
 
             # Avoid duplicates
-            if not any(r.name == req.name for r in self.result.unfulfilled_requirements):
+            if name not in self._requirement_names:
+                self._requirement_names.add(name)
                 self.result.unfulfilled_requirements.append(req)
 
     def _parse_course_list(self, text: str) -> List[str]:
         """Parse a list of course codes from SELECT FROM text"""
         courses = []
+        seen = set()
         # Match course codes like CS 1114, MATH 2114, etc.
-        course_matches = re.findall(r'([A-Z]{2,4}\s*\d{4}[A-Z]?)', text)
-        for c in course_matches:
-            code = re.sub(r'([A-Z]+)\s*(\d+)', r'\1 \2', c)
-            if code not in courses:
+        for match in self.COURSE_CODE_RE.finditer(text):
+            code = f"{match.group(1)} {match.group(2)}"
+            if code not in seen:
+                seen.add(code)
                 courses.append(code)
-        return courses[:20]  # Limit to prevent huge lists
+                if len(courses) >= 20:  # Limit to prevent huge lists
+                    break
+        return courses
 
     def _parse_pathways(self, text: str):
         """Parse Pathways concept completion status"""
-        pathways = [
-            ("Pathways Concept 1", "Discourse"),
-            ("Pathways Concept 2", "Critical Thinking in the Humanities"),
-            ("Pathways Concept 3", "Reasoning in the Social Sciences"),
-            ("Pathways Concept 4", "Reasoning in the Natural Sciences"),
-            ("Pathways Concept 5", "Quantitative and Computational Thinking"),
-            ("Pathways Concept 6", "Critique and Practice in Design and the Arts"),
-            ("Pathways Concept 7", "Critical Analysis of Equity and Identity in the US"),
-        ]
-
-        for concept, name in pathways:
+        # First offset of each concept heading, found in one pass
+        starts: Dict[str, int] = {}
+        for match in self.PATHWAYS_RE.finditer(text):
+            starts.setdefault(match.group(), match.start())
+            if len(starts) == len(PATHWAYS_CONCEPTS):
+                break
+
+        for concept, name in PATHWAYS_CONCEPTS:
             # Check if completed or has NEEDS
-            section_start = text.find(concept)
+            section_start = starts.get(concept, -1)
             if section_start != -1:
                 section = text[section_start:section_start+1000]
                 if "Completed" in section and "NEEDS:" not in section[:500]:
@@ -439,17 +497,15 @@ class DARSParser:
     def _parse_minor(self, text: str):
         """Parse minor information"""
         # Look for "X Minor" section header
-        minor_match = re.search(r'([A-Z][A-Za-z\s]+?)\s+Minor\s*\n', text)
+        minor_match = self.MINOR_RE.search(text)
         if minor_match:
             minor_name = minor_match.group(1).strip()
             # Clean up any garbage before the actual minor name
             # Look for common minor names
-            if "Computer Science" in minor_name:
-                self.result.minor = "Computer Science"
-            elif "Mathematics" in minor_name:
-                self.result.minor = "Mathematics"
-            elif "Statistics" in minor_name:
-                self.result.minor = "Statistics"
+            for known in KNOWN_MINORS:
+                if known in minor_name:
+                    self.result.minor = known
+                    break
             else:
                 # Get last few words which are likely the minor name
                 words = minor_name.split()
@@ -459,10 +515,77 @@ class DARSParser:
                     self.result.minor = minor_name
 
 
+def _clone(obj):
+    """Shallow-copy a slotted dataclass instance"""
+    clone = object.__new__(type(obj))
+    for name in type(obj).__slots__:
+        setattr(clone, name, getattr(obj, name))
+    return clone
+
+
+def _copy_result(result: DARSResult) -> DARSResult:
+    """Copy a cached result so callers can't mutate the cache.
+
+    Course fields are immutable, so a shallow clone per course is a full
+    copy; courses listed as both transfer and completed stay shared.
+    """
+    clones: Dict[int, Course] = {}
+
+    def copy_courses(courses: List[Course]) -> List[Course]:
+        copied = []
+        for course in courses:
+            clone = clones.get(id(course))
+            if clone is None:
+                clone = clones[id(course)] = _clone(course)
+            copied.append(clone)
+        return copied
+
+    copied = _clone(result)
+    copied.completed_courses = copy_courses(result.completed_courses)
+    copied.in_progress_courses = copy_courses(result.in_progress_courses)
+    copied.withdrawn_courses = copy_courses(result.withdrawn_courses)
+    copied.transfer_courses = copy_courses(result.transfer_courses)
+    copied.unfulfilled_requirements = []
+    for req in result.unfulfilled_requirements:
+        req = _clone(req)
+        req.select_from = list(req.select_from)
+        copied.unfulfilled_requirements.append(req)
+    copied.pathways_status = dict(result.pathways_status)
+    return copied
+
+
+# Most recent parse_dars results, keyed by a digest of the raw text
+PARSE_CACHE_SIZE = 32
+_parse_cache: Dict[bytes, DARSResult] = {}
+
+
 def parse_dars(text: str) -> DARSResult:
-    """Convenience function to parse DARS text"""
-    parser = DARSParser()
-    return parser.parse(text)
+    """Convenience function to parse DARS text (repeat uploads are cached)"""
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    result = _parse_cache.get(key)
+    if result is None:
+        result = DARSParser().parse(text)
+        if len(_parse_cache) >= PARSE_CACHE_SIZE:
+            _parse_cache.pop(next(iter(_parse_cache)))
+        _parse_cache[key] = result
+    return _copy_result(result)
+
+
+# Serialized field order for each course/requirement list in dars_to_dict
+COMPLETED_FIELDS = ("code", "name", "credits", "grade", "term", "term_name")
+IN_PROGRESS_FIELDS = ("code", "name", "credits", "term", "term_name")
+WITHDRAWN_FIELDS = ("code", "name", "term")
+REQUIREMENT_FIELDS = ("name", "hours_needed", "courses_needed", "select_from")
+
+_completed_values = attrgetter(*COMPLETED_FIELDS)
+_in_progress_values = attrgetter(*IN_PROGRESS_FIELDS)
+_withdrawn_values = attrgetter(*WITHDRAWN_FIELDS)
+_requirement_values = attrgetter(*REQUIREMENT_FIELDS)
+
+
+def _to_rows(items: list, fields: Tuple[str, ...], values: attrgetter) -> List[dict]:
+    """Serialize objects to dicts keyed by fields"""
+    return [dict(zip(fields, values(item))) for item in items]
 
 
 def dars_to_dict(result: DARSResult) -> dict:
@@ -488,44 +611,10 @@ def dars_to_dict(result: DARSResult) -> dict:
             "vt": result.vt_credits,
             "transfer": result.transfer_credits,
         },
-        "completed_courses": [
-            {
-                "code": c.code,
-                "name": c.name,
-                "credits": c.credits,
-                "grade": c.grade,
-                "term": c.term,
-                "term_name": c.term_name,
-            }
-            for c in result.completed_courses
-        ],
-        "in_progress_courses": [
-            {
-                "code": c.code,
-                "name": c.name,
-                "credits": c.credits,
-                "term": c.term,
-                "term_name": c.term_name,
-            }
-            for c in result.in_progress_courses
-        ],
-        "withdrawn_courses": [
-            {
-                "code": c.code,
-                "name": c.name,
-                "term": c.term,
-            }
-            for c in result.withdrawn_courses
-        ],
-        "requirements_needed": [
-            {
-                "name": r.name,
-                "hours_needed": r.hours_needed,
-                "courses_needed": r.courses_needed,
-                "select_from": r.select_from,
-            }
-            for r in result.unfulfilled_requirements
-        ],
+        "completed_courses": _to_rows(result.completed_courses, COMPLETED_FIELDS, _completed_values),
+        "in_progress_courses": _to_rows(result.in_progress_courses, IN_PROGRESS_FIELDS, _in_progress_values),
+        "withdrawn_courses": _to_rows(result.withdrawn_courses, WITHDRAWN_FIELDS, _withdrawn_values),
+        "requirements_needed": _to_rows(result.unfulfilled_requirements, REQUIREMENT_FIELDS, _requirement_values),
         "pathways_status": result.pathways_status,
     }
 
@@ -7,16 +7,46 @@ Falls back to the legacy Python-defined requirements if JSON not available.
 """
 
 import json
+import re
 from pathlib import Path
 from typing import Optional, Dict, List
 
 REQUIREMENTS_FILE = Path(__file__).parent / "data" / "degree_requirements.json"
+
+# Normalized course code ("CS3114") split into department and number
+COURSE_CODE_RE = re.compile(r'(\D+)(\d+)')
 _cache = None
+# Course code as written in the requirements file -> normalized form, built
+# with the cache so audits don't re-normalize catalog codes on every call
+_normalized_codes: Dict[str, str] = {}
+
+
+def _normalize_code(code: str) -> str:
+    """Normalize a course code for comparison ("cs 3114" -> "CS3114")"""
+    return code.upper().replace(" ", "").replace("-", "")
+
+
+def _index_course_codes(data: Dict) -> Dict[str, str]:
+    """Map every course code referenced by programs and minors to its normalized form"""
+    codes: List[str] = []
+    for program in data.get("programs", {}).values():
+        codes += program.get("core_courses", [])
+        codes += program.get("math_requirements", [])
+        for choice in program.get("choice_requirements", {}).values():
+            codes += choice.get("from", [])
+        science = program.get("science_requirements", {})
+        for seq in science.get("sequences", []) + science.get("required", []):
+            codes += seq.get("courses", [])
+        for conc in (program.get("concentrations") or {}).values():
+            codes += conc.get("additional_core", [])
+    for minor in data.get("minors", {}).values():
+        codes += minor.get("required_courses", [])
+    return {code: _normalize_code(code) for code in codes}
 
 
 def load_all_requirements() -> Dict:
     """Load all degree requirements from JSON file (cached)."""
-    global _cache
+    global _cache, _normalized_codes
     if _cache is None:
         try:
             with open(REQUIREMENTS_FILE, 'r') as f:
@@ -28,6 +58,7 @@ def load_all_requirements() -> Dict:
         except json.JSONDecodeError as e:
             print(f"⚠ Error parsing degree_requirements.json: {e}")
             _cache = {"programs": {}, "minors": {}, "metadata": {}}
+        _normalized_codes = _index_course_codes(_cache)
     return _cache
 
 
@@ -54,19 +85,20 @@ def load_requirements(major_code: str, concentration: str = None) -> Optional[Di
     if not program:
         return None
 
-    # Make a copy so we don't mutate cache
-    result = json.loads(json.dumps(program))
+    # Shallow copy: nested values are shared with the cache, so overrides below
+    # replace keys with new objects instead of mutating them in place
+    result = dict(program)
 
     # If concentration specified, merge concentration-specific overrides
     if concentration and "concentrations" in result:
         conc = result["concentrations"].get(concentration)
         if conc:
-            # Merge additional core courses
+            # Merge additional core courses (deduplicated, catalog order kept)
             if "additional_core" in conc:
-                result["core_courses"] = list(set(result["core_courses"] + conc["additional_core"]))
+                result["core_courses"] = list(dict.fromkeys(result["core_courses"] + conc["additional_core"]))
             # Merge additional elective requirements
             if "additional_electives" in conc:
-                result["elective_requirements"].update(conc["additional_electives"])
+                result["elective_requirements"] = {**result["elective_requirements"], **conc["additional_electives"]}
             # Override recommended sequence if concentration has one
             if "recommended_sequence" in conc:
                 result["recommended_sequence"] = conc["recommended_sequence"]
@@ -122,10 +154,12 @@ def get_needed_courses(major_code: str, completed: List[str],
     if not req:
         return {"error": f"No requirements found for {major_code}"}
 
-    completed_set = set(c.upper().replace(" ", "").replace("-", "") for c in completed)
+    completed_set = set(_normalize_code(c) for c in completed)
+    normalized = _normalized_codes
 
     def normalize(code):
-        return code.upper().replace(" ", "").replace("-", "")
+        norm = normalized.get(code)
+        return norm if norm is not None else _normalize_code(code)
 
     result = {
         "required": [],
@@ -224,21 +258,11 @@ def _count_matching_courses(completed_set: set, filter_str: str) -> int:
     count = 0
     for code in completed_set:
         # Parse department and number from normalized code
-        dept = ""
-        num_str = ""
-        for i, ch in enumerate(code):
-            if ch.isdigit():
-                dept = code[:i]
-                num_str = code[i:]
-                break
-
-        if not dept or not num_str:
-            continue
-
-        try:
-            num = int(num_str)
-        except ValueError:
+        match = COURSE_CODE_RE.fullmatch(code)
+        if not match:
             continue
+        dept = match.group(1)
+        num = int(match.group(2))
 
         if dept_filter == "STEM":
             if dept in stem_depts and num >= min_level:
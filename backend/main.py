@@ -22,7 +22,7 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Request
+from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr, validator
@@ -1634,13 +1634,13 @@ class PlanAnalysisRequest(BaseModel):
 
 
 # Import the AI Advisor
-from ai_advisor import advisor as vt_advisor, CAREER_PATHS
+from ai_advisor import get_advisor, CAREER_PATHS
 
 @app.post("/analyze-plan")
 async def analyze_plan(data: PlanAnalysisRequest):
     """AI-powered analysis of a graduation plan using VT-specific rules"""
     try:
-        analysis = await vt_advisor.analyze_plan(
+        analysis = await get_advisor().analyze_plan(
             plan=data.plan,
             completed=data.completed,
             in_progress=data.in_progress,
@@ -1663,7 +1663,7 @@ class SuggestCoursesRequest(BaseModel):
 async def suggest_courses(data: SuggestCoursesRequest):
     """Get AI-powered course suggestions based on progress and career goals"""
     try:
-        suggestions = vt_advisor.suggest_courses(
+        suggestions = get_advisor().suggest_courses(
             completed=data.completed,
             current_plan=data.current_plan,
             career_interest=data.career_interest
@@ -1689,7 +1689,7 @@ class SimulateCourseRequest(BaseModel):
 async def simulate_course(data: SimulateCourseRequest):
     """Simulate adding a course and see the impact on plan score"""
     try:
-        result = await vt_advisor.simulate_addition(
+        result = await get_advisor().simulate_addition(
             course=data.course,
             semester=data.semester,
             current_plan=data.current_plan,
@@ -1809,7 +1809,7 @@ async def list_programs():
 @app.get("/degree-requirements")
 async def get_degree_requirements(major: Optional[str] = None):
     """Get degree requirements for a major (defaults to CS if not specified)"""
-    from degree_requirements import get_requirements, SUPPORTED_MAJORS, check_graduation_progress
+    from degree_requirements import get_requirements, check_graduation_progress
 
     major_code = (major or "CS").upper()
     req = get_requirements(major_code)
@@ -1834,50 +1834,78 @@ async def get_degree_requirements(major: Optional[str] = None):
         }
     else:
         # Fallback to generic requirements for unsupported majors
-        from ai_advisor import DegreeRequirement as OldDegreeRequirement
+        from ai_advisor import CS_CORE_ORDERED, MATH_CORE_ORDERED, TOTAL_CREDITS
         return {
             "success": True,
             "major": "Computer Science",
             "major_code": "CS",
             "requirements": {
-                "core_courses": OldDegreeRequirement.CS_CORE,
-                "math_requirements": OldDegreeRequirement.MATH_CORE,
-                "total_credits": OldDegreeRequirement.TOTAL_CREDITS
+                "core_courses": list(CS_CORE_ORDERED),
+                "math_requirements": list(MATH_CORE_ORDERED),
+                "total_credits": TOTAL_CREDITS
             }
         }
 
 
+# Encoded bodies and ETags for the catalog endpoints. The catalog tables are
+# static for the life of the process, so each payload is encoded once. Only
+# majors that have concentrations get a /concentrations entry, which keeps this
+# bounded by the catalog.
+_catalog_responses: Dict[str, tuple] = {}
+
+
+def _catalog_response(request: Request, key: str, build_payload) -> Response:
+    """Return a cached catalog payload, or 304 when the client's ETag matches"""
+    cached = _catalog_responses.get(key)
+    if cached is None:
+        body = json.dumps(build_payload(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+        cached = _catalog_responses[key] = (body, etag)
+    body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 @app.get("/majors")
-async def get_majors():
+async def get_majors(request: Request):
     """Get list of all supported majors"""
-    from degree_requirements import SUPPORTED_MAJORS
-    return {
+    from catalog_display import SUPPORTED_MAJORS
+    return _catalog_response(request, "majors", lambda: {
         "success": True,
-        "majors": SUPPORTED_MAJORS
-    }
+        "majors": [m.to_dict() for m in SUPPORTED_MAJORS]
+    })
 
 
 @app.get("/minors")
-async def get_minors():
+async def get_minors(request: Request):
     """Get list of all supported minors"""
-    from degree_requirements import SUPPORTED_MINORS
-    return {
+    from catalog_display import SUPPORTED_MINORS
+    return _catalog_response(request, "minors", lambda: {
         "success": True,
-        "minors": SUPPORTED_MINORS
-    }
+        "minors": [m.to_dict() for m in SUPPORTED_MINORS]
+    })
 
 
 @app.get("/concentrations")
-async def get_concentrations(major: str):
+async def get_concentrations(request: Request, major: str):
     """Get available concentrations for a specific major"""
-    from degree_requirements import get_concentrations
-    concentrations = get_concentrations(major)
-    return {
+    from catalog_display import get_concentrations
+    major_code = major.upper()
+    concentrations = get_concentrations(major_code)
+    if not concentrations:
+        return {
+            "success": True,
+            "major": major_code,
+            "concentrations": [],
+            "has_concentrations": False
+        }
+    return _catalog_response(request, "concentrations:" + major_code, lambda: {
         "success": True,
-        "major": major.upper(),
-        "concentrations": concentrations,
-        "has_concentrations": len(concentrations) > 0
-    }
+        "major": major_code,
+        "concentrations": [c.to_dict() for c in concentrations],
+        "has_concentrations": True
+    })
 
 
 @app.get("/graduation-progress")